@@ -0,0 +1,92 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from ttg_quant.activity import (
+    DEFAULT_MIN_PREMIUM,
+    DEFAULT_MIN_VOLUME,
+    DEFAULT_TOP_N,
+    DEFAULT_TRAILING_DAYS,
+    scan_unusual_activity,
+)
+
+
+def _positive_seconds(value):
+    try:
+        seconds = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid number of seconds '{value}'.") from exc
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"Deadline must be positive, got '{value}'.")
+    return seconds
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Scan full options chains for unusual activity (volume/OI, volume vs trailing average, premium)."
+    )
+    parser.add_argument("--tickers", required=True, help="Comma-separated watchlist, e.g. AAPL,MSFT,NVDA")
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N, help="Contracts to return per ticker")
+    parser.add_argument(
+        "--min-volume",
+        type=int,
+        default=DEFAULT_MIN_VOLUME,
+        help="Skip contracts that traded fewer contracts today",
+    )
+    parser.add_argument(
+        "--min-premium",
+        type=float,
+        default=DEFAULT_MIN_PREMIUM,
+        help="Skip contracts with less premium traded today, in dollars",
+    )
+    parser.add_argument(
+        "--trailing-days",
+        type=int,
+        default=DEFAULT_TRAILING_DAYS,
+        help="Sessions of daily volume to average for flagged contracts (0 skips the history lookup)",
+    )
+    parser.add_argument(
+        "--strike-range-pct",
+        type=float,
+        required=False,
+        help="Optional max distance of strikes from the underlying price, in percent",
+    )
+    parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Time budget per ticker; slow fetches are cut off and that ticker is marked \"partial\": true",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output (default behavior; kept for compatibility)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        result = scan_unusual_activity(
+            tickers=args.tickers.split(","),
+            top_n=max(1, args.top_n),
+            min_volume=args.min_volume,
+            min_premium=args.min_premium,
+            trailing_days=args.trailing_days,
+            strike_range_pct=args.strike_range_pct,
+            deadline_seconds=args.deadline_seconds,
+        )
+        print(json.dumps(result.to_dict(), indent=2, default=str))
+        return 0
+    except Exception as exc:
+        print(json.dumps({"error": str(exc)}), file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,86 +2,30 @@ import argparse
 import datetime as dt
 import json
 import logging
-import os
 import sys
+from pathlib import Path
 
-import pandas as pd
-import requests
-from scipy.signal import find_peaks
-
-MASSIVE_API_BASE_URL = os.getenv("MASSIVE_API_BASE_URL")
-MASSIVE_API_KEY = os.getenv("MASSIVE_API_KEY")
-MASSIVE_HTTP_TIMEOUT_SECONDS = int(os.getenv("MASSIVE_HTTP_TIMEOUT_SECONDS", "20"))
-SUPPORTED_TIMEFRAMES = ("minute", "hour", "day", "week", "month", "quarter", "year")
-
-
-def _normalize_timeframe(timeframe):
-    normalized = timeframe.strip().lower()
-    if normalized not in SUPPORTED_TIMEFRAMES:
-        supported = "|".join(SUPPORTED_TIMEFRAMES)
-        raise ValueError(f"Invalid timeframe '{timeframe}'. Supported values: {supported}")
-    return normalized
-
-
-def fetch_massive_data(ticker, multiplier, timeframe, start_date, end_date):
-    if not MASSIVE_API_BASE_URL:
-        raise RuntimeError("Missing MASSIVE_API_BASE_URL in environment")
-    if not MASSIVE_API_KEY:
-        raise RuntimeError("Missing MASSIVE_API_KEY in environment")
-
-    capitalize_ticker = ticker.upper().strip()
-    normalized_timeframe = _normalize_timeframe(timeframe)
-    url = f"{MASSIVE_API_BASE_URL.rstrip('/')}/v2/aggs/ticker/{capitalize_ticker}/range/{multiplier}/{normalized_timeframe}/{start_date}/{end_date}"
-    params = {
-        "apiKey": MASSIVE_API_KEY,
-        "adjusted": True,
-        "limit": 50000,
-        "sort": "desc",
-    }
-    try:
-        response = requests.get(url, params=params, timeout=MASSIVE_HTTP_TIMEOUT_SECONDS)
-    except requests.Timeout:
-        raise RuntimeError("Timed out fetching data from Massive.com")
-    except requests.RequestException:
-        raise RuntimeError("Network error fetching data from Massive.com")
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from ttg_quant.levels import (
+    DEFAULT_LEVEL_COUNT,
+    DEFAULT_PEAK_DISTANCE,
+    DEFAULT_SWEEP_GRID,
+    calculate_support_resistance,
+    sweep_support_resistance_levels,
+)
 
-    if response.status_code != 200:
-        raise RuntimeError(f"Error fetching data from Massive.com: {response.status_code} {response.text}")
 
+def _positive_seconds(value):
     try:
-        data = response.json()
-    except ValueError:
-        raise RuntimeError("Invalid response from Massive.com")
-
-    if "results" not in data:
-        raise RuntimeError("No data found for the given parameters")
-
-    return pd.DataFrame(data["results"])
-
-def find_support_resistance(df):
-    peaks, _ = find_peaks(df["c"], distance=20)
-    troughs, _ = find_peaks(-df["c"], distance=20)
-    resistance_prices = df["c"].iloc[peaks].values
-    support_prices = df["c"].iloc[troughs].values
-    support_levels = pd.Series(support_prices).value_counts().nlargest(3).index.tolist()
-    resistance_levels = pd.Series(resistance_prices).value_counts().nlargest(3).index.tolist()
-    return support_levels, resistance_levels
-
-def calculate_support_resistance(ticker, multiplier, timeframe, start_date, end_date, include_data=False):
-    df = fetch_massive_data(ticker, multiplier, timeframe, start_date, end_date)
-    support_levels, resistance_levels = find_support_resistance(df)
-
-    result = {
-        "support_levels": support_levels,
-        "resistance_levels": resistance_levels,
-    }
-    if include_data:
-        df["Date"] = pd.to_datetime(df["t"], unit="ms", utc=True).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-        response_columns = ["Date", "t", "o", "h", "l", "c", "v"]
-        df_clean = df[response_columns].replace({pd.NA: None, pd.NaT: None, float("inf"): None, float("-inf"): None})
-        data_records = df_clean.where(pd.notnull(df_clean), None).to_dict(orient="records")
-        result["data"] = data_records
-    return result
+        seconds = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid number of seconds '{value}'.") from exc
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"Deadline must be positive, got '{value}'.")
+    return seconds
 
 
 def _valid_date(date_string):
@@ -92,6 +36,24 @@ def _valid_date(date_string):
     return date_string
 
 
+def _number_list(cast):
+    def parse(value):
+        try:
+            return tuple(None if item.strip().lower() == "none" else cast(item) for item in value.split(","))
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"Invalid list '{value}'. Use comma-separated numbers.") from exc
+
+    return parse
+
+
+def _single_value(values, name):
+    if values is None:
+        return None
+    if len(values) != 1:
+        raise ValueError(f"{name} takes one value unless --sweep is passed")
+    return values[0]
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Fetch stock OHLC bars and compute support/resistance levels.")
     parser.add_argument("--ticker", required=True, help="Ticker symbol, e.g. AAPL")
@@ -108,6 +70,30 @@ def parse_args():
     )
     parser.add_argument("--start-date", required=True, type=_valid_date, help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end-date", required=True, type=_valid_date, help="End date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--method",
+        default="pivots",
+        help="Level detector (case-insensitive): pivots (closing-price peaks) or volume-profile (volume-by-price nodes)",
+    )
+    parser.add_argument("--distance", type=_number_list(int), help="Min bars between pivots (default 20); comma list with --sweep")
+    parser.add_argument("--prominence", type=_number_list(float), help="Min pivot prominence in price units; comma list with --sweep")
+    parser.add_argument("--levels", type=_number_list(int), help="Levels to return per side (default 3); comma list with --sweep")
+    parser.add_argument(
+        "--tolerance-pct",
+        type=_number_list(float),
+        help="Merge pivots within this percent into one zone; comma list with --sweep",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Evaluate every combination of --distance/--prominence/--levels/--tolerance-pct on one fetch of bars",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes for --sweep (default: CPU count)")
+    parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Overall time budget for fetching bars; fails with an error if the budget runs out",
+    )
     parser.add_argument(
         "--include-data",
         action="store_true",
@@ -126,6 +112,23 @@ def main():
     args = parse_args()
 
     try:
+        if args.sweep:
+            result = sweep_support_resistance_levels(
+                ticker=args.ticker,
+                multiplier=args.multiplier,
+                timeframe=args.timeframe,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                distances=args.distance or DEFAULT_SWEEP_GRID["distances"],
+                prominences=args.prominence or DEFAULT_SWEEP_GRID["prominences"],
+                level_counts=args.levels or DEFAULT_SWEEP_GRID["level_counts"],
+                tolerances=args.tolerance_pct or DEFAULT_SWEEP_GRID["tolerances"],
+                workers=args.workers,
+                deadline_seconds=args.deadline_seconds,
+            )
+            print(json.dumps(result.to_dict(), indent=2, default=str))
+            return 0
+
         result = calculate_support_resistance(
             ticker=args.ticker,
             multiplier=args.multiplier,
@@ -133,8 +136,14 @@ def main():
             start_date=args.start_date,
             end_date=args.end_date,
             include_data=args.include_data,
+            method=args.method,
+            distance=_single_value(args.distance, "--distance") or DEFAULT_PEAK_DISTANCE,
+            prominence=_single_value(args.prominence, "--prominence"),
+            levels=_single_value(args.levels, "--levels") or DEFAULT_LEVEL_COUNT,
+            tolerance_pct=_single_value(args.tolerance_pct, "--tolerance-pct"),
+            deadline_seconds=args.deadline_seconds,
         )
-        print(json.dumps(result, indent=2, default=str))
+        print(json.dumps(result.to_dict(), indent=2, default=str))
         return 0
     except Exception as exc:
         print(json.dumps({"error": str(exc)}), file=sys.stderr)
@@ -1,16 +1,25 @@
 import argparse
+import asyncio
+import concurrent.futures
 import datetime as dt
-import importlib.util
 import json
 import os
 import sys
-from pathlib import Path
+import threading
+import time
 
+import ttg_quant
+from ttg_quant.activity import (
+    DEFAULT_MIN_PREMIUM,
+    DEFAULT_MIN_VOLUME,
+    DEFAULT_TOP_N as DEFAULT_UNUSUAL_TOP_N,
+    DEFAULT_TRAILING_DAYS,
+    scan_unusual_activity_async,
+)
+from ttg_quant.levels import DEFAULT_LEVEL_COUNT, DEFAULT_PEAK_DISTANCE, DEFAULT_SWEEP_GRID, fetch_bars_async
+from ttg_quant.options import get_top_options_async, load_chain_index_async, select_top_options
 
-ROOT_DIR = Path(__file__).resolve().parent
-ITM_SCRIPT = ROOT_DIR / "options" / "top-itm-contracts.py"
-OTM_SCRIPT = ROOT_DIR / "options" / "top-otm-contracts.py"
-SUPPORT_RESISTANCE_SCRIPT = ROOT_DIR / "stocks" / "support-resistance.py"
+SUPPORT_RESISTANCE_DEFAULTS = {"multiplier": 1, "timeframe": "day", "start_date": "2026-01-01"}
 
 
 def _color(text, code):
@@ -19,25 +28,107 @@ def _color(text, code):
     return f"\033[{code}m{text}\033[0m"
 
 
-def _load_module(file_path, module_name):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {file_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+async def _stamped(coroutine):
+    value = await coroutine
+    return time.monotonic(), value
 
 
-def _get_itm_module():
-    return _load_module(ITM_SCRIPT, "top_itm_contracts")
+class _Prefetcher:
+    """Background event loop that starts fetches while the interactive prompts are still open."""
 
+    def __init__(self):
+        self.client = ttg_quant.MassiveClient()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="ttg-prefetch", daemon=True)
+        self._thread.start()
+        self._pending = {}
 
-def _get_otm_module():
-    return _load_module(OTM_SCRIPT, "top_otm_contracts")
+    def run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
 
+    def start(self, key, coroutine_function, *args, **kwargs):
+        if key not in self._pending:
+            coroutine = _stamped(coroutine_function(*args, client=self.client, **kwargs))
+            self._pending[key] = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def take(self, key):
+        # Waits for an in-flight prefetch instead of duplicating it. Failures are swallowed:
+        # the real call repeats the fetch and reports the error itself.
+        future = self._pending.pop(key, None)
+        if future is None:
+            return None
+        waited = not future.done()
+        try:
+            finished_at, value = future.result()
+        except (Exception, concurrent.futures.CancelledError):
+            return None
+        # A result that sat finished on screen longer than a cached chain may live is stale;
+        # returning None makes the caller fetch afresh.
+        if not waited and time.monotonic() - finished_at > self.client.config.chain_cache_ttl_seconds:
+            return None
+        return value
+
+    def cancel_except(self, *keys):
+        for key in [key for key in self._pending if key not in keys]:
+            self._pending.pop(key).cancel()
+
+    async def _shutdown(self):
+        # Cancelled prefetches can leave shared work behind (e.g. a coalesced price batch that is
+        # only scheduled on the next loop iteration), so keep sweeping until nothing is left.
+        while True:
+            await asyncio.sleep(0)
+            leftovers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            if not leftovers:
+                break
+            for task in leftovers:
+                task.cancel()
+            await asyncio.gather(*leftovers, return_exceptions=True)
+        await self.client.close()
+
+    def close(self):
+        self.cancel_except()
+        self.run(self._shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _chain_key(side, ticker, expiration_date):
+    return ("chain", side, ticker.upper().strip(), expiration_date)
+
+
+def _bars_key(ticker, multiplier, timeframe, start_date, end_date):
+    return ("bars", ticker.upper().strip(), multiplier, timeframe, start_date, end_date)
+
+
+def _prefetch_chain(prefetcher, side, ticker, expiration_date):
+    prefetcher.start(
+        _chain_key(side, ticker, expiration_date),
+        load_chain_index_async,
+        ticker.upper().strip(),
+        side,
+        expiration_date=expiration_date,
+    )
+
+
+def _unusual_chain_key(ticker):
+    return ("chain", "full", ticker.upper().strip())
 
-def _get_support_resistance_module():
-    return _load_module(SUPPORT_RESISTANCE_SCRIPT, "support_resistance")
+
+def _prefetch_unusual_chain(prefetcher, ticker):
+    prefetcher.start(_unusual_chain_key(ticker), load_chain_index_async, ticker.upper().strip(), full_chain=True)
+
+
+def _prefetch_bars(prefetcher, ticker, multiplier, timeframe, start_date, end_date):
+    prefetcher.start(
+        _bars_key(ticker, multiplier, timeframe, start_date, end_date),
+        fetch_bars_async,
+        ticker,
+        multiplier,
+        timeframe,
+        start_date,
+        end_date,
+    )
 
 
 def _valid_date(value):
@@ -48,6 +139,41 @@ def _valid_date(value):
     return value
 
 
+def _number_list(cast):
+    def parse(value):
+        try:
+            return tuple(None if item.strip().lower() == "none" else cast(item) for item in value.split(","))
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"Invalid list '{value}'. Use comma-separated numbers.") from exc
+
+    return parse
+
+
+def _positive_seconds(value):
+    try:
+        seconds = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid number of seconds '{value}'.") from exc
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"Deadline must be positive, got '{value}'.")
+    return seconds
+
+
+def _ticker_list(value):
+    tickers = [item.strip().upper() for item in value.split(",") if item.strip()]
+    if not tickers:
+        raise argparse.ArgumentTypeError("Provide at least one ticker, e.g. AAPL,MSFT,NVDA.")
+    return tickers
+
+
+def _single_value(values, name):
+    if values is None:
+        return None
+    if len(values) != 1:
+        raise ValueError(f"{name} takes one value unless --sweep is passed")
+    return values[0]
+
+
 def _prompt_required(prompt_text, default=None):
     while True:
         suffix = f" [{default}]" if default is not None else ""
@@ -127,13 +253,15 @@ def _print_support_resistance_cheatsheet():
     print(" - 5 + minute = 5-minute bars")
     print(" - 1 + day    = 1-day bars")
     print(" - 1 + week   = 1-week bars")
+    print("")
+    print("Method           : pivots (closing-price peaks) | volume-profile (volume-by-price nodes)")
     print(_color("-" * 72, "90"))
     print("")
 
 
 def _build_parser():
     parser = argparse.ArgumentParser(
-        description="Unified launcher for TTG quant tools (ITM, OTM, support/resistance)."
+        description="Unified launcher for TTG quant tools (ITM, OTM, unusual activity, support/resistance)."
     )
 
     subparsers = parser.add_subparsers(dest="command")
@@ -142,6 +270,28 @@ def _build_parser():
     itm_parser.add_argument("--ticker", required=True, help="Underlying ticker, e.g. AAPL")
     itm_parser.add_argument("--expiration-date", required=False, help="Optional expiration date YYYY-MM-DD")
     itm_parser.add_argument("--top-n", type=int, default=2, help="How many contracts to return")
+    itm_parser.add_argument(
+        "--strike-range-pct",
+        type=float,
+        required=False,
+        help="Optional max distance of strikes from the underlying price, in percent",
+    )
+    itm_parser.add_argument(
+        "--moneyness",
+        choices=("strike", "delta"),
+        default="strike",
+        help="Classify ITM by strike vs underlying price (default) or by |delta| > 0.5",
+    )
+    itm_parser.add_argument(
+        "--term-structure",
+        action="store_true",
+        help="Return top ITM contracts and call/put volume for every expiration instead of one",
+    )
+    itm_parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Overall time budget; slow fetches are cut off and the output is marked \"partial\": true",
+    )
     itm_parser.add_argument(
         "--pretty",
         action="store_true",
@@ -152,12 +302,82 @@ def _build_parser():
     otm_parser.add_argument("--ticker", required=True, help="Underlying ticker, e.g. AAPL")
     otm_parser.add_argument("--expiration-date", required=False, help="Optional expiration date YYYY-MM-DD")
     otm_parser.add_argument("--top-n", type=int, default=2, help="How many contracts to return")
+    otm_parser.add_argument(
+        "--strike-range-pct",
+        type=float,
+        required=False,
+        help="Optional max distance of strikes from the underlying price, in percent",
+    )
+    otm_parser.add_argument(
+        "--moneyness",
+        choices=("strike", "delta"),
+        default="strike",
+        help="Classify OTM by strike vs underlying price (default) or by |delta| < 0.5",
+    )
+    otm_parser.add_argument(
+        "--term-structure",
+        action="store_true",
+        help="Return top OTM contracts and call/put volume for every expiration instead of one",
+    )
+    otm_parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Overall time budget; slow fetches are cut off and the output is marked \"partial\": true",
+    )
     otm_parser.add_argument(
         "--pretty",
         action="store_true",
         help="Pretty-print JSON output (default behavior; kept for compatibility)",
     )
 
+    unusual_parser = subparsers.add_parser("unusual", help="Unusual options activity across full chains")
+    unusual_parser.add_argument(
+        "--tickers",
+        required=True,
+        type=_ticker_list,
+        help="Comma-separated watchlist, e.g. AAPL,MSFT,NVDA (scanned concurrently)",
+    )
+    unusual_parser.add_argument(
+        "--top-n",
+        type=int,
+        default=DEFAULT_UNUSUAL_TOP_N,
+        help=f"Contracts to return per ticker (default {DEFAULT_UNUSUAL_TOP_N})",
+    )
+    unusual_parser.add_argument(
+        "--min-volume",
+        type=int,
+        default=DEFAULT_MIN_VOLUME,
+        help=f"Skip contracts that traded fewer contracts today (default {DEFAULT_MIN_VOLUME})",
+    )
+    unusual_parser.add_argument(
+        "--min-premium",
+        type=float,
+        default=DEFAULT_MIN_PREMIUM,
+        help=f"Skip contracts with less premium traded today, in dollars (default {DEFAULT_MIN_PREMIUM:,})",
+    )
+    unusual_parser.add_argument(
+        "--trailing-days",
+        type=int,
+        default=DEFAULT_TRAILING_DAYS,
+        help=f"Sessions of daily volume to average for flagged contracts (default {DEFAULT_TRAILING_DAYS}; 0 skips)",
+    )
+    unusual_parser.add_argument(
+        "--strike-range-pct",
+        type=float,
+        required=False,
+        help="Optional max distance of strikes from the underlying price, in percent",
+    )
+    unusual_parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Time budget per ticker; slow fetches are cut off and that ticker is marked \"partial\": true",
+    )
+    unusual_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print JSON output (default behavior; kept for compatibility)",
+    )
+
     sr_parser = subparsers.add_parser("support-resistance", help="Support/resistance from OHLC bars")
     sr_parser.add_argument("--ticker", required=True, help="Ticker symbol, e.g. AAPL")
     sr_parser.add_argument(
@@ -173,6 +393,30 @@ def _build_parser():
     )
     sr_parser.add_argument("--start-date", required=True, type=_valid_date, help="Start date YYYY-MM-DD")
     sr_parser.add_argument("--end-date", required=True, type=_valid_date, help="End date YYYY-MM-DD")
+    sr_parser.add_argument(
+        "--method",
+        default="pivots",
+        help="Level detector (case-insensitive): pivots (closing-price peaks) or volume-profile (volume-by-price nodes)",
+    )
+    sr_parser.add_argument("--distance", type=_number_list(int), help="Min bars between pivots (default 20); comma list with --sweep")
+    sr_parser.add_argument("--prominence", type=_number_list(float), help="Min pivot prominence in price units; comma list with --sweep")
+    sr_parser.add_argument("--levels", type=_number_list(int), help="Levels to return per side (default 3); comma list with --sweep")
+    sr_parser.add_argument(
+        "--tolerance-pct",
+        type=_number_list(float),
+        help="Merge pivots within this percent into one zone; comma list with --sweep",
+    )
+    sr_parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Evaluate every combination of --distance/--prominence/--levels/--tolerance-pct on one fetch of bars",
+    )
+    sr_parser.add_argument("--workers", type=int, help="Worker processes for --sweep (default: CPU count)")
+    sr_parser.add_argument(
+        "--deadline-seconds",
+        type=_positive_seconds,
+        help="Overall time budget for fetching bars; fails with an error if the budget runs out",
+    )
     sr_parser.add_argument(
         "--include-data",
         action="store_true",
@@ -187,37 +431,163 @@ def _build_parser():
     return parser
 
 
-def _run_itm(ticker, expiration_date=None, top_n=2):
-    module = _get_itm_module()
-    return module.get_top_itm_options(
-        ticker=ticker,
-        expiration_date=expiration_date,
-        top_n=max(1, int(top_n)),
-    )
-
-
-def _run_otm(ticker, expiration_date=None, top_n=2):
-    module = _get_otm_module()
-    return module.get_top_otm_options(
+def _run_itm(
+    ticker,
+    expiration_date=None,
+    top_n=2,
+    strike_range_pct=None,
+    moneyness="strike",
+    term_structure=False,
+    deadline_seconds=None,
+):
+    if term_structure:
+        result = ttg_quant.get_term_structure(
+            ticker=ticker,
+            side="itm",
+            top_n=max(1, int(top_n)),
+            strike_range_pct=strike_range_pct,
+            moneyness=moneyness,
+            deadline_seconds=deadline_seconds,
+        )
+    else:
+        result = ttg_quant.get_top_itm_options(
+            ticker=ticker,
+            expiration_date=expiration_date,
+            top_n=max(1, int(top_n)),
+            strike_range_pct=strike_range_pct,
+            moneyness=moneyness,
+            deadline_seconds=deadline_seconds,
+        )
+    return result.to_dict()
+
+
+def _run_otm(
+    ticker,
+    expiration_date=None,
+    top_n=2,
+    strike_range_pct=None,
+    moneyness="strike",
+    term_structure=False,
+    deadline_seconds=None,
+):
+    if term_structure:
+        result = ttg_quant.get_term_structure(
+            ticker=ticker,
+            side="otm",
+            top_n=max(1, int(top_n)),
+            strike_range_pct=strike_range_pct,
+            moneyness=moneyness,
+            deadline_seconds=deadline_seconds,
+        )
+    else:
+        result = ttg_quant.get_top_otm_options(
+            ticker=ticker,
+            expiration_date=expiration_date,
+            top_n=max(1, int(top_n)),
+            strike_range_pct=strike_range_pct,
+            moneyness=moneyness,
+            deadline_seconds=deadline_seconds,
+        )
+    return result.to_dict()
+
+
+def _run_support_resistance(
+    ticker,
+    multiplier,
+    timeframe,
+    start_date,
+    end_date,
+    include_data=False,
+    method="pivots",
+    distance=None,
+    prominence=None,
+    levels=None,
+    tolerance_pct=None,
+    deadline_seconds=None,
+):
+    result = ttg_quant.calculate_support_resistance(
         ticker=ticker,
-        expiration_date=expiration_date,
-        top_n=max(1, int(top_n)),
+        multiplier=multiplier,
+        timeframe=timeframe,
+        start_date=start_date,
+        end_date=end_date,
+        include_data=include_data,
+        method=method,
+        distance=distance or DEFAULT_PEAK_DISTANCE,
+        prominence=prominence,
+        levels=levels or DEFAULT_LEVEL_COUNT,
+        tolerance_pct=tolerance_pct,
+        deadline_seconds=deadline_seconds,
     )
-
-
-def _run_support_resistance(ticker, multiplier, timeframe, start_date, end_date, include_data=False):
-    module = _get_support_resistance_module()
-    return module.calculate_support_resistance(
+    return result.to_dict()
+
+
+def _run_support_resistance_sweep(
+    ticker,
+    multiplier,
+    timeframe,
+    start_date,
+    end_date,
+    distances=None,
+    prominences=None,
+    level_counts=None,
+    tolerances=None,
+    workers=None,
+    deadline_seconds=None,
+):
+    result = ttg_quant.sweep_support_resistance_levels(
         ticker=ticker,
         multiplier=multiplier,
         timeframe=timeframe,
         start_date=start_date,
         end_date=end_date,
-        include_data=include_data,
+        distances=distances or DEFAULT_SWEEP_GRID["distances"],
+        prominences=prominences or DEFAULT_SWEEP_GRID["prominences"],
+        level_counts=level_counts or DEFAULT_SWEEP_GRID["level_counts"],
+        tolerances=tolerances or DEFAULT_SWEEP_GRID["tolerances"],
+        workers=workers,
+        deadline_seconds=deadline_seconds,
+    )
+    return result.to_dict()
+
+
+def _run_unusual_activity(
+    tickers,
+    top_n=DEFAULT_UNUSUAL_TOP_N,
+    min_volume=DEFAULT_MIN_VOLUME,
+    min_premium=DEFAULT_MIN_PREMIUM,
+    trailing_days=DEFAULT_TRAILING_DAYS,
+    strike_range_pct=None,
+    deadline_seconds=None,
+):
+    result = ttg_quant.scan_unusual_activity(
+        tickers=tickers,
+        top_n=max(1, int(top_n)),
+        min_volume=min_volume,
+        min_premium=min_premium,
+        trailing_days=trailing_days,
+        strike_range_pct=strike_range_pct,
+        deadline_seconds=deadline_seconds,
     )
+    return result.to_dict()
 
 
-def _run_itm_interactive_once(previous_settings=None, ticker_only=False, reuse_all=False):
+def _run_options_prefetched(prefetcher, side, ticker, expiration_date, top_n):
+    key = _chain_key(side, ticker, expiration_date)
+    prefetcher.cancel_except(key)
+    snapshot = prefetcher.take(key)
+    if snapshot is None:
+        result = prefetcher.run(
+            get_top_options_async(ticker, side, expiration_date, max(1, int(top_n)), client=prefetcher.client)
+        )
+    else:
+        # Rank straight from the prefetched chain; take() already dropped it if it went stale.
+        underlying_price, chain_index = snapshot
+        result = select_top_options(ticker, underlying_price, chain_index, side, expiration_date, max(1, int(top_n)))
+    return result.to_dict()
+
+
+def _run_itm_interactive_once(previous_settings=None, ticker_only=False, reuse_all=False, prefetcher=None):
     if reuse_all and previous_settings:
         ticker = previous_settings["ticker"]
         expiration_date = previous_settings["expiration_date"]
@@ -228,10 +598,17 @@ def _run_itm_interactive_once(previous_settings=None, ticker_only=False, reuse_a
         top_n = previous_settings["top_n"]
     else:
         ticker = _prompt_required("Enter as single ticker symbol")
+        if prefetcher is not None:
+            _prefetch_chain(prefetcher, "itm", ticker, None)
         expiration_date = _prompt_optional_date("Expiration date")
+        if prefetcher is not None and expiration_date:
+            _prefetch_chain(prefetcher, "itm", ticker, expiration_date)
         top_n = _prompt_positive_int("Top contracts to return", default=2)
 
-    result = _run_itm(ticker=ticker, expiration_date=expiration_date, top_n=top_n)
+    if prefetcher is None:
+        result = _run_itm(ticker=ticker, expiration_date=expiration_date, top_n=top_n)
+    else:
+        result = _run_options_prefetched(prefetcher, "itm", ticker, expiration_date, top_n)
     settings = {
         "ticker": ticker,
         "expiration_date": expiration_date,
@@ -240,7 +617,7 @@ def _run_itm_interactive_once(previous_settings=None, ticker_only=False, reuse_a
     return result, settings
 
 
-def _run_otm_interactive_once(previous_settings=None, ticker_only=False, reuse_all=False):
+def _run_otm_interactive_once(previous_settings=None, ticker_only=False, reuse_all=False, prefetcher=None):
     if reuse_all and previous_settings:
         ticker = previous_settings["ticker"]
         expiration_date = previous_settings["expiration_date"]
@@ -251,10 +628,17 @@ def _run_otm_interactive_once(previous_settings=None, ticker_only=False, reuse_a
         top_n = previous_settings["top_n"]
     else:
         ticker = _prompt_required("Enter as single ticker symbol")
+        if prefetcher is not None:
+            _prefetch_chain(prefetcher, "otm", ticker, None)
         expiration_date = _prompt_optional_date("Expiration date")
+        if prefetcher is not None and expiration_date:
+            _prefetch_chain(prefetcher, "otm", ticker, expiration_date)
         top_n = _prompt_positive_int("Top contracts to return", default=2)
 
-    result = _run_otm(ticker=ticker, expiration_date=expiration_date, top_n=top_n)
+    if prefetcher is None:
+        result = _run_otm(ticker=ticker, expiration_date=expiration_date, top_n=top_n)
+    else:
+        result = _run_options_prefetched(prefetcher, "otm", ticker, expiration_date, top_n)
     settings = {
         "ticker": ticker,
         "expiration_date": expiration_date,
@@ -263,41 +647,92 @@ def _run_otm_interactive_once(previous_settings=None, ticker_only=False, reuse_a
     return result, settings
 
 
-def _run_support_resistance_interactive_once(previous_settings=None, ticker_only=False):
+def _run_unusual_interactive_once(previous_settings=None, ticker_only=False, prefetcher=None):
+    if ticker_only and previous_settings:
+        tickers = _ticker_list(_prompt_required("Enter tickers (comma-separated)"))
+        top_n = previous_settings["top_n"]
+    else:
+        tickers = _ticker_list(_prompt_required("Enter tickers (comma-separated)"))
+        if prefetcher is not None:
+            for ticker in tickers:
+                _prefetch_unusual_chain(prefetcher, ticker)
+        top_n = _prompt_positive_int("Top contracts per ticker", default=DEFAULT_UNUSUAL_TOP_N)
+
+    if prefetcher is None:
+        result = _run_unusual_activity(tickers=tickers, top_n=top_n)
+    else:
+        keys = {ticker: _unusual_chain_key(ticker) for ticker in tickers}
+        prefetcher.cancel_except(*keys.values())
+        # Tickers whose prefetch failed are fetched again by the scan, which reports the error.
+        chains = {ticker: prefetcher.take(key) for ticker, key in keys.items()}
+        chains = {ticker: chain for ticker, chain in chains.items() if chain is not None}
+        result = prefetcher.run(
+            scan_unusual_activity_async(tickers, top_n, chains=chains, client=prefetcher.client)
+        ).to_dict()
+    settings = {
+        "tickers": tickers,
+        "top_n": top_n,
+    }
+    return result, settings
+
+
+def _run_support_resistance_interactive_once(previous_settings=None, ticker_only=False, prefetcher=None):
     if ticker_only and previous_settings:
         ticker = _prompt_required("Enter as single ticker symbol")
         multiplier = previous_settings["multiplier"]
         timeframe = previous_settings["timeframe"]
         start_date = previous_settings["start_date"]
         end_date = previous_settings["end_date"]
+        method = previous_settings["method"]
     else:
         _print_support_resistance_cheatsheet()
         ticker = _prompt_required("Enter as single ticker symbol")
+        today = dt.date.today().strftime("%Y-%m-%d")
+        if prefetcher is not None:
+            # Most runs keep the prompt defaults, so start on those bars while the rest is typed.
+            _prefetch_bars(prefetcher, ticker, end_date=today, **SUPPORT_RESISTANCE_DEFAULTS)
         multiplier = _prompt_positive_int(
             "Multiplier (whole number, >=1)",
-            default=1,
+            default=SUPPORT_RESISTANCE_DEFAULTS["multiplier"],
         )
-        timeframe = _prompt_required("Timeframe (minute/hour/day/week/month/quarter/year)", default="day")
-        today = dt.date.today().strftime("%Y-%m-%d")
-        start_date = _prompt_required("Start date (YYYY-MM-DD)", default="2026-01-01")
+        timeframe = _prompt_required(
+            "Timeframe (minute/hour/day/week/month/quarter/year)",
+            default=SUPPORT_RESISTANCE_DEFAULTS["timeframe"],
+        )
+        start_date = _prompt_required("Start date (YYYY-MM-DD)", default=SUPPORT_RESISTANCE_DEFAULTS["start_date"])
         end_date = _prompt_required("End date (YYYY-MM-DD)", default=today)
         _valid_date(start_date)
         _valid_date(end_date)
-
-    result = _run_support_resistance(
-        ticker=ticker,
-        multiplier=multiplier,
-        timeframe=timeframe,
-        start_date=start_date,
-        end_date=end_date,
-        include_data=False,
-    )
+        if prefetcher is not None:
+            _prefetch_bars(prefetcher, ticker, multiplier, timeframe, start_date, end_date)
+        method = _prompt_required("Method (pivots/volume-profile)", default="pivots")
+
+    if prefetcher is None:
+        result = _run_support_resistance(
+            ticker=ticker,
+            multiplier=multiplier,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+            include_data=False,
+            method=method,
+        )
+    else:
+        key = _bars_key(ticker, multiplier, timeframe, start_date, end_date)
+        prefetcher.cancel_except(key)
+        bars = prefetcher.take(key)
+        if bars is None:
+            bars = prefetcher.run(
+                fetch_bars_async(ticker, multiplier, timeframe, start_date, end_date, client=prefetcher.client)
+            )
+        result = ttg_quant.analyze_support_resistance(bars, method=method).to_dict()
     settings = {
         "ticker": ticker,
         "multiplier": multiplier,
         "timeframe": timeframe,
         "start_date": start_date,
         "end_date": end_date,
+        "method": method,
     }
     return result, settings
 
@@ -313,13 +748,17 @@ def _post_run_action():
     return _prompt_choice("Enter choice (1/2/3/4)", ("1", "2", "3", "4"))
 
 
-def _run_tool_with_navigation(run_once_callable):
+def _run_tool_with_navigation(run_once_callable, prefetcher=None):
     last_settings = None
     ticker_only = False
 
     while True:
         try:
-            result, last_settings = run_once_callable(previous_settings=last_settings, ticker_only=ticker_only)
+            result, last_settings = run_once_callable(
+                previous_settings=last_settings,
+                ticker_only=ticker_only,
+                prefetcher=prefetcher,
+            )
             ticker_only = False
             print("")
             print(json.dumps(result, indent=2, default=str))
@@ -338,12 +777,14 @@ def _run_tool_with_navigation(run_once_callable):
                 continue
             ticker_only = True
             continue
+        if prefetcher is not None:
+            prefetcher.cancel_except()
         if action == "3":
             return "back"
         return "exit"
 
 
-def _run_options_tool_with_navigation(initial_tool):
+def _run_options_tool_with_navigation(initial_tool, prefetcher=None):
     current_tool = initial_tool
     last_settings = None
     ticker_only = False
@@ -356,15 +797,21 @@ def _run_options_tool_with_navigation(initial_tool):
                     previous_settings=last_settings,
                     ticker_only=ticker_only,
                     reuse_all=reuse_all,
+                    prefetcher=prefetcher,
                 )
             else:
                 result, last_settings = _run_otm_interactive_once(
                     previous_settings=last_settings,
                     ticker_only=ticker_only,
                     reuse_all=reuse_all,
+                    prefetcher=prefetcher,
                 )
             ticker_only = False
             reuse_all = False
+            if prefetcher is not None:
+                # "Run OTM/ITM with same settings" is one keypress away; fetch it while this result is read.
+                opposite = "otm" if current_tool == "itm" else "itm"
+                _prefetch_chain(prefetcher, opposite, last_settings["ticker"], last_settings["expiration_date"])
             print("")
             print(json.dumps(result, indent=2, default=str))
         except Exception as exc:
@@ -401,12 +848,22 @@ def _run_options_tool_with_navigation(initial_tool):
             current_tool = "otm" if current_tool == "itm" else "itm"
             reuse_all = True
             continue
+        if prefetcher is not None:
+            prefetcher.cancel_except()
         if action == "4":
             return "back"
         return "exit"
 
 
 def _run_interactive():
+    prefetcher = _Prefetcher()
+    try:
+        return _run_interactive_menus(prefetcher)
+    finally:
+        prefetcher.close()
+
+
+def _run_interactive_menus(prefetcher):
     while True:
         _print_header()
         print("Choose a category:")
@@ -427,18 +884,21 @@ def _run_interactive():
                 print("Options tools:")
                 print("1) Top ITM options")
                 print("2) Top OTM options")
-                print("3) Go back")
+                print("3) Unusual activity scan")
+                print("4) Go back")
                 print("")
 
-                tool_choice = _prompt_choice("Enter choice (1/2/3)", ("1", "2", "3"))
+                tool_choice = _prompt_choice("Enter choice (1/2/3/4)", ("1", "2", "3", "4"))
                 print("")
-                if tool_choice == "3":
+                if tool_choice == "4":
                     break
 
                 if tool_choice == "1":
-                    nav = _run_options_tool_with_navigation("itm")
+                    nav = _run_options_tool_with_navigation("itm", prefetcher=prefetcher)
+                elif tool_choice == "2":
+                    nav = _run_options_tool_with_navigation("otm", prefetcher=prefetcher)
                 else:
-                    nav = _run_options_tool_with_navigation("otm")
+                    nav = _run_tool_with_navigation(_run_unusual_interactive_once, prefetcher=prefetcher)
 
                 if nav == "exit":
                     return 0
@@ -455,7 +915,7 @@ def _run_interactive():
                 if tool_choice == "2":
                     break
 
-                nav = _run_tool_with_navigation(_run_support_resistance_interactive_once)
+                nav = _run_tool_with_navigation(_run_support_resistance_interactive_once, prefetcher=prefetcher)
                 if nav == "exit":
                     return 0
 
@@ -475,12 +935,44 @@ def main():
                 ticker=args.ticker,
                 expiration_date=args.expiration_date,
                 top_n=args.top_n,
+                strike_range_pct=args.strike_range_pct,
+                moneyness=args.moneyness,
+                term_structure=args.term_structure,
+                deadline_seconds=args.deadline_seconds,
             )
         elif args.command == "otm":
             result = _run_otm(
                 ticker=args.ticker,
                 expiration_date=args.expiration_date,
                 top_n=args.top_n,
+                strike_range_pct=args.strike_range_pct,
+                moneyness=args.moneyness,
+                term_structure=args.term_structure,
+                deadline_seconds=args.deadline_seconds,
+            )
+        elif args.command == "unusual":
+            result = _run_unusual_activity(
+                tickers=args.tickers,
+                top_n=args.top_n,
+                min_volume=args.min_volume,
+                min_premium=args.min_premium,
+                trailing_days=args.trailing_days,
+                strike_range_pct=args.strike_range_pct,
+                deadline_seconds=args.deadline_seconds,
+            )
+        elif args.command == "support-resistance" and args.sweep:
+            result = _run_support_resistance_sweep(
+                ticker=args.ticker,
+                multiplier=args.multiplier,
+                timeframe=args.timeframe,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                distances=args.distance,
+                prominences=args.prominence,
+                level_counts=args.levels,
+                tolerances=args.tolerance_pct,
+                workers=args.workers,
+                deadline_seconds=args.deadline_seconds,
             )
         elif args.command == "support-resistance":
             result = _run_support_resistance(
@@ -490,6 +982,12 @@ def main():
                 start_date=args.start_date,
                 end_date=args.end_date,
                 include_data=args.include_data,
+                method=args.method,
+                distance=_single_value(args.distance, "--distance"),
+                prominence=_single_value(args.prominence, "--prominence"),
+                levels=_single_value(args.levels, "--levels"),
+                tolerance_pct=_single_value(args.tolerance_pct, "--tolerance-pct"),
+                deadline_seconds=args.deadline_seconds,
             )
         else:
             raise RuntimeError(f"Unsupported command: {args.command}")
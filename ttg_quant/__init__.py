@@ -0,0 +1,80 @@
+from .activity import (
+    UnusualActivityResult,
+    UnusualActivityScan,
+    UnusualContract,
+    rank_unusual_activity,
+    scan_unusual_activity,
+    scan_unusual_activity_async,
+)
+from .client import Deadline, DeadlineExceeded, MassiveClient, NoDataFound
+from .config import MassiveConfig
+from .levels import (
+    SupportResistanceResult,
+    SweepResult,
+    SweepRow,
+    VolumeProfile,
+    analyze_support_resistance,
+    calculate_support_resistance,
+    calculate_support_resistance_async,
+    fetch_bars,
+    fetch_bars_async,
+    sweep_support_resistance_levels,
+    sweep_support_resistance_levels_async,
+)
+from .options import (
+    ExpirationSummary,
+    OptionChainIndex,
+    OptionContract,
+    TermStructureResult,
+    TopOptionsResult,
+    get_options_chain_async,
+    get_term_structure,
+    get_term_structure_async,
+    get_top_itm_options,
+    get_top_itm_options_async,
+    get_top_otm_options,
+    get_top_otm_options_async,
+    get_underlying_prices,
+    get_underlying_prices_async,
+    select_top_options,
+)
+
+__all__ = [
+    "Deadline",
+    "DeadlineExceeded",
+    "ExpirationSummary",
+    "MassiveClient",
+    "MassiveConfig",
+    "NoDataFound",
+    "OptionChainIndex",
+    "OptionContract",
+    "SupportResistanceResult",
+    "SweepResult",
+    "SweepRow",
+    "TermStructureResult",
+    "TopOptionsResult",
+    "UnusualActivityResult",
+    "UnusualActivityScan",
+    "UnusualContract",
+    "VolumeProfile",
+    "analyze_support_resistance",
+    "calculate_support_resistance",
+    "calculate_support_resistance_async",
+    "fetch_bars",
+    "fetch_bars_async",
+    "get_options_chain_async",
+    "get_term_structure",
+    "get_term_structure_async",
+    "get_top_itm_options",
+    "get_top_itm_options_async",
+    "get_top_otm_options",
+    "get_top_otm_options_async",
+    "get_underlying_prices",
+    "get_underlying_prices_async",
+    "rank_unusual_activity",
+    "scan_unusual_activity",
+    "scan_unusual_activity_async",
+    "select_top_options",
+    "sweep_support_resistance_levels",
+    "sweep_support_resistance_levels_async",
+]
@@ -0,0 +1,250 @@
+import asyncio
+import datetime as dt
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from .client import Deadline, MassiveClient, NoDataFound, run_with_client, with_client
+from .config import MassiveConfig
+from .options import OptionChainIndex, OptionContract, _or_na, load_chain_index_async
+
+CONTRACT_MULTIPLIER = 100
+DEFAULT_MIN_PREMIUM = 25_000
+DEFAULT_MIN_VOLUME = 100
+DEFAULT_TOP_N = 10
+DEFAULT_TRAILING_DAYS = 20
+
+# Daily bars before today never change, so trailing averages are kept until the date rolls over.
+# Keyed by the last session date; only the current one is retained. Locked like the chain cache,
+# since sync callers on different threads share it.
+_TRAILING_VOLUME_CACHE = {}
+_TRAILING_VOLUME_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class UnusualContract:
+    option: OptionContract
+    volume_oi_ratio: float
+    premium: float
+    trailing_average_volume: float | None = None
+
+    @property
+    def volume_vs_average(self) -> float | None:
+        if not self.trailing_average_volume:
+            return None
+        return round((self.option.volume or 0) / self.trailing_average_volume, 4)
+
+    def to_dict(self) -> dict:
+        return {
+            **self.option.to_dict(),
+            "open_interest": _or_na(self.option.open_interest),
+            "volume_oi_ratio": self.volume_oi_ratio,
+            "premium": self.premium,
+            "trailing_average_volume": _or_na(self.trailing_average_volume),
+            "volume_vs_average": _or_na(self.volume_vs_average),
+        }
+
+
+@dataclass(slots=True)
+class UnusualActivityResult:
+    ticker: str
+    underlying_price: float
+    contracts: list[UnusualContract]
+    partial: bool = False
+
+    def to_dict(self) -> dict:
+        result = {
+            "ticker": self.ticker,
+            "underlying_price": self.underlying_price,
+            "contracts": [contract.to_dict() for contract in self.contracts],
+        }
+        if self.partial:
+            result["partial"] = True
+        return result
+
+
+@dataclass(slots=True)
+class UnusualActivityScan:
+    results: list[UnusualActivityResult]
+    # Tickers that could not be scanned, with the reason; the rest of the watchlist still reports.
+    errors: dict[str, str]
+
+    def to_dict(self) -> dict:
+        result = {"results": [ticker_result.to_dict() for ticker_result in self.results]}
+        if self.errors:
+            result["errors"] = self.errors
+        return result
+
+
+def rank_unusual_activity(
+    options: list[OptionContract],
+    top_n: int = DEFAULT_TOP_N,
+    min_volume: int = DEFAULT_MIN_VOLUME,
+    min_premium: float = DEFAULT_MIN_PREMIUM,
+) -> list[UnusualContract]:
+    count = len(options)
+    volume = np.fromiter((option.volume or 0 for option in options), dtype=float, count=count)
+    open_interest = np.fromiter((option.open_interest or 0 for option in options), dtype=float, count=count)
+    price = np.fromiter(
+        (option.mid_price or option.last_trade_price or 0 for option in options),
+        dtype=float,
+        count=count,
+    )
+    # Zero open interest counts as one contract, so fresh strikes rank high without dividing by zero.
+    ratio = volume / np.maximum(open_interest, 1)
+    premium = volume * price * CONTRACT_MULTIPLIER
+
+    eligible = np.flatnonzero((volume >= min_volume) & (premium >= min_premium))
+    # Highest volume/OI first; premium breaks ties between equally crowded strikes.
+    order = eligible[np.lexsort((-premium[eligible], -ratio[eligible]))][:top_n]
+    return [
+        UnusualContract(
+            option=options[index],
+            volume_oi_ratio=round(float(ratio[index]), 4),
+            premium=round(float(premium[index]), 2),
+        )
+        for index in order
+    ]
+
+
+async def _trailing_average_volume(contract_ticker, trailing_days, deadline, client):
+    end = dt.date.today() - dt.timedelta(days=1)
+    cache_key = (client.config.base_url, contract_ticker, trailing_days)
+    with _TRAILING_VOLUME_CACHE_LOCK:
+        averages = _TRAILING_VOLUME_CACHE.get(end)
+        if averages is None:
+            _TRAILING_VOLUME_CACHE.clear()
+            averages = _TRAILING_VOLUME_CACHE[end] = {}
+        if cache_key in averages:
+            return averages[cache_key]
+
+    # Enough calendar days to cover the sessions plus weekends and holidays.
+    start = end - dt.timedelta(days=trailing_days * 7 // 5 + 7)
+    try:
+        bars = await client.get_aggregates(contract_ticker, 1, "day", start.isoformat(), end.isoformat(), deadline)
+    except NoDataFound:
+        # Newly listed or never traded contracts have no history to compare against. Other
+        # failures (rate limits, timeouts) propagate uncached so the next scan retries them.
+        bars = []
+    # Bars arrive newest-first. Sessions without trades have no bar, so this averages over the
+    # most recent days the contract traded.
+    volumes = [bar.get("v") or 0 for bar in bars[:trailing_days]]
+    average = round(sum(volumes) / len(volumes), 2) if volumes else None
+    with _TRAILING_VOLUME_CACHE_LOCK:
+        averages[cache_key] = average
+    return average
+
+
+async def _scan_ticker(ticker, top_n, min_volume, min_premium, trailing_days, strike_range_pct, deadline, client, chain):
+    if chain is None:
+        chain = await load_chain_index_async(
+            ticker,
+            strike_range_pct=strike_range_pct,
+            full_chain=True,
+            deadline=deadline,
+            client=client,
+        )
+    underlying_price, chain_index = chain
+    if not chain_index.expirations:
+        raise RuntimeError("No options contracts found.")
+
+    flagged = rank_unusual_activity(chain_index.contracts(), top_n, min_volume, min_premium)
+    history_missing = False
+    if trailing_days > 0 and flagged:
+        # History is fetched only for the flagged contracts, not the whole chain.
+        averages = await asyncio.gather(
+            *(_trailing_average_volume(contract.option.ticker, trailing_days, deadline, client) for contract in flagged),
+            return_exceptions=True,
+        )
+        for contract, average in zip(flagged, averages):
+            if isinstance(average, Exception):
+                # The ranking stands without the optional history: a lookup that ran out of time or
+                # was rate limited leaves N/A for that contract and marks the ticker partial.
+                history_missing = True
+                continue
+            if isinstance(average, BaseException):
+                raise average
+            contract.trailing_average_volume = average
+
+    return UnusualActivityResult(
+        ticker=ticker,
+        underlying_price=underlying_price,
+        contracts=flagged,
+        partial=deadline.partial or history_missing,
+    )
+
+
+@with_client
+async def scan_unusual_activity_async(
+    tickers: list[str],
+    top_n: int = DEFAULT_TOP_N,
+    min_volume: int = DEFAULT_MIN_VOLUME,
+    min_premium: float = DEFAULT_MIN_PREMIUM,
+    trailing_days: int = DEFAULT_TRAILING_DAYS,
+    strike_range_pct: float | None = None,
+    deadline_seconds: float | None = None,
+    *,
+    chains: dict[str, tuple[float, OptionChainIndex]] | None = None,
+    client: MassiveClient,
+) -> UnusualActivityScan:
+    # chains: already-loaded (underlying_price, full chain index) pairs by ticker, e.g. from a prefetch.
+    normalized_tickers = list(dict.fromkeys(ticker.upper().strip() for ticker in tickers if ticker.strip()))
+    if not normalized_tickers:
+        raise ValueError("At least one ticker is required.")
+    chains = chains or {}
+
+    # Tickers run concurrently on one client: their price lookups coalesce into one snapshot
+    # request and their chain pages share the connection pool and request limit.
+    outcomes = await asyncio.gather(
+        *(
+            _scan_ticker(
+                ticker,
+                max(1, int(top_n)),
+                min_volume,
+                min_premium,
+                trailing_days,
+                strike_range_pct,
+                Deadline(deadline_seconds),
+                client,
+                chains.get(ticker),
+            )
+            for ticker in normalized_tickers
+        ),
+        return_exceptions=True,
+    )
+    results = []
+    errors = {}
+    for ticker, outcome in zip(normalized_tickers, outcomes):
+        if isinstance(outcome, Exception):
+            errors[ticker] = str(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
+    if not results:
+        raise RuntimeError("; ".join(f"{ticker}: {error}" for ticker, error in errors.items()))
+    return UnusualActivityScan(results=results, errors=errors)
+
+
+def scan_unusual_activity(
+    tickers: list[str],
+    top_n: int = DEFAULT_TOP_N,
+    min_volume: int = DEFAULT_MIN_VOLUME,
+    min_premium: float = DEFAULT_MIN_PREMIUM,
+    trailing_days: int = DEFAULT_TRAILING_DAYS,
+    strike_range_pct: float | None = None,
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> UnusualActivityScan:
+    return run_with_client(
+        config,
+        scan_unusual_activity_async,
+        tickers,
+        top_n,
+        min_volume,
+        min_premium,
+        trailing_days,
+        strike_range_pct,
+        deadline_seconds,
+    )
@@ -0,0 +1,336 @@
+import asyncio
+import collections
+import functools
+import time
+import urllib.parse
+
+import aiohttp
+
+from .config import MassiveConfig
+
+# Tickers per stock snapshot request; keeps the query string well inside URL length limits.
+STOCK_SNAPSHOT_CHUNK_SIZE = 250
+HEDGE_LATENCY_QUANTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+# Never hedge sooner than this, so scheduling jitter on fast responses does not double the load.
+HEDGE_MIN_DELAY_SECONDS = 0.05
+LATENCY_WINDOW = 256
+# Bar pages can be megabytes and are few per command; a duplicate costs more than it saves.
+UNHEDGED_ENDPOINTS = frozenset({"aggregates"})
+
+
+class DeadlineExceeded(RuntimeError):
+    pass
+
+
+class NoDataFound(RuntimeError):
+    pass
+
+
+class Deadline:
+    """Remaining-time budget for one command, shared by every fetch it makes."""
+
+    def __init__(self, seconds: float | None):
+        # None means no budget; a zero or negative budget is a caller error, not "unlimited".
+        if seconds is not None and seconds <= 0:
+            raise ValueError(f"Deadline must be positive, got {seconds:g}s")
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        # Set by any step that dropped work to stay inside the budget.
+        self.partial = False
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def exceeded(self) -> DeadlineExceeded:
+        return DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded before Massive.com responded")
+
+    def timeout(self) -> float | None:
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise self.exceeded()
+        return remaining
+
+
+def _mark_retrieved(task):
+    # Losing hedge attempts are cancelled or fail unobserved; read the outcome so asyncio does not warn.
+    if not task.cancelled():
+        task.exception()
+
+
+class MassiveClient:
+    """Massive.com HTTP client: one pooled session and one request limit, bound to one event loop."""
+
+    def __init__(self, config: MassiveConfig | None = None, session: aiohttp.ClientSession | None = None):
+        self.config = config or MassiveConfig.from_env()
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = None
+        self._price_requests = {}
+        self._price_batches = set()
+        self._latencies = collections.defaultdict(lambda: collections.deque(maxlen=LATENCY_WINDOW))
+
+    async def __aenter__(self) -> "MassiveClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.config.max_concurrency, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._owns_session = True
+        return self._session
+
+    def _request_slot(self) -> asyncio.Semaphore:
+        # Created on first use so it binds to the loop the client actually runs on.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        return self._semaphore
+
+    def _url(self, path: str) -> str:
+        self.config.require_credentials()
+        return f"{self.config.base_url.rstrip('/')}{path}"
+
+    async def _timed_get(self, endpoint, url, params, check_status, responded=None):
+        async with self._request_slot():
+            started = time.monotonic()
+            async with self.session.get(url, params=params) as response:
+                # Latency is time to the response headers: body size depends on the query, not on
+                # how healthy the server is, and a response already streaming is never hedged.
+                self._latencies[endpoint].append(time.monotonic() - started)
+                if responded is not None and not responded.done():
+                    responded.set_result(None)
+                if check_status and response.status != 200:
+                    text = await response.text()
+                    raise RuntimeError(f"Error fetching data from Massive.com: {response.status} {text}")
+                return await response.json(content_type=None)
+
+    def _hedge_delay(self, endpoint):
+        if not self.config.hedge_requests or endpoint in UNHEDGED_ENDPOINTS:
+            return None
+        samples = self._latencies[endpoint]
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            # One-shot commands rarely see enough responses to learn a p95, so by default
+            # they do not hedge at all rather than duplicating on a guessed timer.
+            return self.config.hedge_after_seconds or None
+        return max(sorted(samples)[int(HEDGE_LATENCY_QUANTILE * (len(samples) - 1))], HEDGE_MIN_DELAY_SECONDS)
+
+    async def _hedged_get(self, endpoint, url, params, check_status):
+        # All Massive calls are idempotent reads, so a request whose headers are slower than this
+        # endpoint's p95 gets one duplicate and whichever answers first wins.
+        responded = asyncio.get_running_loop().create_future()
+        attempts = [asyncio.ensure_future(self._timed_get(endpoint, url, params, check_status, responded))]
+        attempts[0].add_done_callback(_mark_retrieved)
+        try:
+            delay = self._hedge_delay(endpoint)
+            if delay is not None:
+                await asyncio.wait([responded, attempts[0]], timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                # With every slot busy the wait is queueing, not a slow server; a duplicate would only queue too.
+                if not responded.done() and not attempts[0].done() and not self._request_slot().locked():
+                    attempts.append(asyncio.ensure_future(self._timed_get(endpoint, url, params, check_status)))
+                    attempts[1].add_done_callback(_mark_retrieved)
+            pending = set(attempts)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                    error = attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict,
+        check_status: bool = False,
+        deadline: Deadline | None = None,
+        endpoint: str = "default",
+    ) -> dict:
+        timeout = deadline.timeout() if deadline is not None else None
+        try:
+            return await asyncio.wait_for(self._hedged_get(endpoint, url, params, check_status), timeout)
+        except asyncio.TimeoutError:
+            if timeout is not None and deadline.remaining() <= 0:
+                raise deadline.exceeded() from None
+            raise
+
+    def _split_next_url(self, next_url: str) -> tuple[str, dict]:
+        # next_url carries the cursor but not the API key; keep both in params so aiohttp encodes them once.
+        parts = urllib.parse.urlsplit(next_url)
+        params = dict(urllib.parse.parse_qsl(parts.query))
+        params["apiKey"] = self.config.api_key
+        return urllib.parse.urlunsplit(parts._replace(query="")), params
+
+    async def get_underlying_prices(self, tickers: list[str], deadline: Deadline | None = None) -> dict[str, float]:
+        url = self._url("/v2/snapshot/locale/us/markets/stocks/tickers")
+        unique = list(dict.fromkeys(tickers))
+        chunks = [unique[start : start + STOCK_SNAPSHOT_CHUNK_SIZE] for start in range(0, len(unique), STOCK_SNAPSHOT_CHUNK_SIZE)]
+        responses = await asyncio.gather(
+            *(
+                self.get_json(url, {"tickers": ",".join(chunk), "apiKey": self.config.api_key}, deadline=deadline, endpoint="stocks")
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        prices = {}
+        for data in responses:
+            if isinstance(data, DeadlineExceeded):
+                # Chunks that missed the budget are left out; callers see fewer prices and deadline.partial.
+                deadline.partial = True
+                continue
+            if isinstance(data, BaseException):
+                raise data
+            if "tickers" not in data:
+                raise RuntimeError(f"Error fetching stock snapshot: {data}")
+            for snapshot in data["tickers"] or ():
+                # Fall back to the session and previous closes before the first trade of the day.
+                price = (
+                    (snapshot.get("lastTrade") or {}).get("p")
+                    or (snapshot.get("day") or {}).get("c")
+                    or (snapshot.get("prevDay") or {}).get("c")
+                )
+                if price:
+                    prices[snapshot["ticker"]] = price
+        return prices
+
+    async def get_underlying_price(self, ticker: str, deadline: Deadline | None = None) -> float:
+        # Lookups made in the same loop iteration (e.g. a gathered multi-ticker scan) are
+        # coalesced into one batched snapshot request. The batch is shared, so each caller
+        # only bounds its own wait by its deadline.
+        timeout = deadline.timeout() if deadline is not None else None
+        future = self._price_requests.get(ticker)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._price_requests:
+                loop.call_soon(self._flush_price_requests)
+            future = self._price_requests[ticker] = loop.create_future()
+            # Every waiter may have given up (deadline, cancelled prefetch) before the batch lands.
+            future.add_done_callback(_mark_retrieved)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if timeout is not None and deadline.remaining() <= 0:
+                raise deadline.exceeded() from None
+            raise
+
+    def _flush_price_requests(self) -> None:
+        pending, self._price_requests = self._price_requests, {}
+        batch = asyncio.ensure_future(self._resolve_price_requests(pending))
+        self._price_batches.add(batch)
+        batch.add_done_callback(self._price_batches.discard)
+
+    async def _resolve_price_requests(self, pending: dict[str, asyncio.Future]) -> None:
+        try:
+            prices = await self.get_underlying_prices(list(pending))
+        except Exception as exc:
+            for future in pending.values():
+                future.set_exception(exc)
+            return
+        for ticker, future in pending.items():
+            if ticker in prices:
+                future.set_result(prices[ticker])
+            else:
+                future.set_exception(RuntimeError(f"Error fetching last trade for {ticker}: not found in snapshot"))
+
+    async def get_options_snapshot(
+        self,
+        ticker: str,
+        filters: dict,
+        max_pages: int | None = 1,
+        deadline: Deadline | None = None,
+    ) -> list[dict]:
+        url = self._url(f"/v3/snapshot/options/{ticker}")
+        params = {**filters, "apiKey": self.config.api_key}
+        results = []
+        pages = 0
+        while True:
+            try:
+                data = await self.get_json(url, params, deadline=deadline, endpoint="options")
+            except DeadlineExceeded:
+                if not pages:
+                    raise
+                # Keep the pages that made it inside the budget.
+                deadline.partial = True
+                return results
+            if "results" not in data:
+                raise RuntimeError(f"Error fetching options chain for {ticker}: {data}")
+            results.extend(data["results"])
+            pages += 1
+            next_url = data.get("next_url")
+            if not next_url or (max_pages is not None and pages >= max_pages):
+                return results
+            url, params = self._split_next_url(next_url)
+
+    async def get_aggregates(
+        self,
+        ticker: str,
+        multiplier: int,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        deadline: Deadline | None = None,
+    ) -> list[dict]:
+        url = self._url(f"/v2/aggs/ticker/{ticker}/range/{multiplier}/{timeframe}/{start_date}/{end_date}")
+        params = {
+            "apiKey": self.config.api_key,
+            "adjusted": "true",
+            "limit": 50000,
+            "sort": "desc",
+        }
+        # A page holds at most 50,000 bars (a few months of minute bars), so follow next_url
+        # until the whole range has arrived.
+        results = []
+        while True:
+            try:
+                data = await self.get_json(url, params, check_status=True, deadline=deadline, endpoint="aggregates")
+            except asyncio.TimeoutError:
+                raise RuntimeError("Timed out fetching data from Massive.com")
+            except aiohttp.ClientError:
+                raise RuntimeError("Network error fetching data from Massive.com")
+            except ValueError:
+                raise RuntimeError("Invalid response from Massive.com")
+
+            if "results" not in data:
+                if results:
+                    return results
+                raise NoDataFound("No data found for the given parameters")
+            results.extend(data["results"])
+            next_url = data.get("next_url")
+            if not next_url:
+                return results
+            url, params = self._split_next_url(next_url)
+
+
+def with_client(coroutine_function):
+    # Lets every *_async API take an optional client; without one, a client is opened from the environment.
+    @functools.wraps(coroutine_function)
+    async def wrapper(*args, client: MassiveClient | None = None, **kwargs):
+        if client is not None:
+            return await coroutine_function(*args, client=client, **kwargs)
+        async with MassiveClient() as client:
+            return await coroutine_function(*args, client=client, **kwargs)
+
+    return wrapper
+
+
+def run_with_client(config: MassiveConfig | None, coroutine_function, *args, **kwargs):
+    async def runner():
+        async with MassiveClient(config) as client:
+            return await coroutine_function(*args, client=client, **kwargs)
+
+    return asyncio.run(runner())
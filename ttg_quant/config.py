@@ -0,0 +1,40 @@
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+DEFAULT_RISK_FREE_RATE = 0.04
+
+
+@dataclass(frozen=True, slots=True)
+class MassiveConfig:
+    """Connection and pricing settings for the Massive.com API."""
+
+    base_url: str | None = None
+    api_key: str | None = None
+    timeout_seconds: float = 20
+    max_concurrency: int = 16
+    risk_free_rate: float = DEFAULT_RISK_FREE_RATE
+    chain_cache_ttl_seconds: float = 30
+    hedge_requests: bool = True
+    # Fixed hedge delay used until enough latencies are seen to estimate p95; 0 waits for the p95.
+    hedge_after_seconds: float = 0
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "MassiveConfig":
+        environ = os.environ if environ is None else environ
+        return cls(
+            base_url=environ.get("MASSIVE_API_BASE_URL"),
+            api_key=environ.get("MASSIVE_API_KEY"),
+            timeout_seconds=int(environ.get("MASSIVE_HTTP_TIMEOUT_SECONDS", "20")),
+            max_concurrency=int(environ.get("MASSIVE_MAX_CONCURRENCY", "16")),
+            risk_free_rate=float(environ.get("RISK_FREE_RATE", str(DEFAULT_RISK_FREE_RATE))),
+            chain_cache_ttl_seconds=float(environ.get("CHAIN_CACHE_TTL_SECONDS", "30")),
+            hedge_requests=environ.get("MASSIVE_HEDGE_REQUESTS", "1").strip().lower() not in ("0", "false", "no"),
+            hedge_after_seconds=float(environ.get("MASSIVE_HEDGE_AFTER_SECONDS", "0")),
+        )
+
+    def require_credentials(self) -> None:
+        if not self.base_url:
+            raise RuntimeError("Missing MASSIVE_API_BASE_URL in environment")
+        if not self.api_key:
+            raise RuntimeError("Missing MASSIVE_API_KEY in environment")
@@ -0,0 +1,535 @@
+import asyncio
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.signal import find_peaks
+
+from .client import Deadline, MassiveClient, run_with_client, with_client
+from .config import MassiveConfig
+
+SUPPORTED_TIMEFRAMES = ("minute", "hour", "day", "week", "month", "quarter", "year")
+SUPPORTED_METHODS = ("pivots", "volume-profile")
+VOLUME_PROFILE_BINS = 100
+VOLUME_PROFILE_VALUE_AREA = 0.70
+VOLUME_PROFILE_CHUNK_SIZE = 65536
+PRICE_COLUMNS = ("o", "h", "l", "c")
+# float32 prices are kept only when every price sits on a 4-decimal tick and round-trips within half a tick.
+PRICE_FLOAT32_TOLERANCE = 5e-5
+DEFAULT_PEAK_DISTANCE = 20
+DEFAULT_LEVEL_COUNT = 3
+DEFAULT_SWEEP_GRID = {
+    "distances": (5, 10, 20, 40),
+    "prominences": (None,),
+    "level_counts": (3, 5),
+    "tolerances": (None, 0.25, 0.5),
+}
+
+_SWEEP_CLOSES = None
+
+
+@dataclass(slots=True)
+class VolumeProfile:
+    point_of_control: float
+    value_area_high: float
+    value_area_low: float
+    high_volume_nodes: list[float]
+
+    def to_dict(self) -> dict:
+        return {
+            "point_of_control": self.point_of_control,
+            "value_area_high": self.value_area_high,
+            "value_area_low": self.value_area_low,
+            "high_volume_nodes": self.high_volume_nodes,
+        }
+
+
+@dataclass(slots=True)
+class SupportResistanceResult:
+    support_levels: list[float]
+    resistance_levels: list[float]
+    volume_profile: VolumeProfile | None = None
+    # Oldest-first bar frame, kept only when include_data was requested.
+    bars: pd.DataFrame | None = None
+
+    def to_dict(self) -> dict:
+        result = {
+            "support_levels": self.support_levels,
+            "resistance_levels": self.resistance_levels,
+        }
+        if self.volume_profile is not None:
+            result["volume_profile"] = self.volume_profile.to_dict()
+        if self.bars is not None:
+            result["data"] = bar_records(self.bars)
+        return result
+
+
+@dataclass(slots=True)
+class SweepRow:
+    distance: int
+    prominence: float | None
+    levels: int
+    tolerance_pct: float | None
+    support_levels: list[float]
+    resistance_levels: list[float]
+
+    def to_dict(self) -> dict:
+        return {
+            "distance": self.distance,
+            "prominence": self.prominence,
+            "levels": self.levels,
+            "tolerance_pct": self.tolerance_pct,
+            "support_levels": self.support_levels,
+            "resistance_levels": self.resistance_levels,
+        }
+
+
+@dataclass(slots=True)
+class SweepResult:
+    ticker: str
+    bars: int
+    results: list[SweepRow]
+
+    def to_dict(self) -> dict:
+        return {
+            "ticker": self.ticker,
+            "bars": self.bars,
+            "results": [row.to_dict() for row in self.results],
+        }
+
+
+def _normalize_timeframe(timeframe):
+    normalized = timeframe.strip().lower()
+    if normalized not in SUPPORTED_TIMEFRAMES:
+        supported = "|".join(SUPPORTED_TIMEFRAMES)
+        raise ValueError(f"Invalid timeframe '{timeframe}'. Supported values: {supported}")
+    return normalized
+
+
+def _normalize_method(method):
+    normalized = method.strip().lower()
+    if normalized not in SUPPORTED_METHODS:
+        supported = "|".join(SUPPORTED_METHODS)
+        raise ValueError(f"Invalid method '{method}'. Supported values: {supported}")
+    return normalized
+
+
+def build_bars_frame(results: list[dict]) -> pd.DataFrame:
+    count = len(results)
+    timestamps = np.fromiter((bar["t"] for bar in results), dtype=np.int64, count=count)
+    prices = {
+        name: np.fromiter((bar.get(name, np.nan) for bar in results), dtype=np.float64, count=count)
+        for name in PRICE_COLUMNS
+    }
+    volumes = np.fromiter((bar.get("v", 0) for bar in results), dtype=np.float64, count=count)
+
+    narrowed = {name: values.astype(np.float32) for name, values in prices.items()}
+    # Off-tick prices stay float64: narrowing would merge distinct pivots into one rounded level.
+    fits_float32 = all(
+        np.array_equal(np.round(values, 4), values, equal_nan=True)
+        and np.max(np.abs(narrowed[name] - values), initial=0.0, where=np.isfinite(values)) <= PRICE_FLOAT32_TOLERANCE
+        for name, values in prices.items()
+    )
+    columns = {"t": timestamps, **(narrowed if fits_float32 else prices), "v": np.rint(volumes).astype(np.uint64)}
+
+    # Bars are requested newest-first, so a capped response keeps the most recent ones; flip
+    # them to oldest-first with a view, and only pay for a sort if the API sent anything else.
+    if count > 1 and timestamps[0] > timestamps[-1]:
+        columns = {name: values[::-1] for name, values in columns.items()}
+        timestamps = columns["t"]
+    if count and np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        columns = {name: values[order] for name, values in columns.items()}
+    return pd.DataFrame(columns, copy=False)
+
+
+def bar_records(df: pd.DataFrame) -> list[dict]:
+    # Bars are analysed oldest-first but returned newest-first, as the API sends them.
+    df = df.iloc[::-1].copy()
+    df["Date"] = pd.to_datetime(df["t"], unit="ms", utc=True).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    for name in PRICE_COLUMNS:
+        if df[name].dtype == np.float32:
+            df[name] = df[name].astype(np.float64).round(4)
+    response_columns = ["Date", "t", "o", "h", "l", "c", "v"]
+    df_clean = df[response_columns].replace({pd.NA: None, pd.NaT: None, float("inf"): None, float("-inf"): None})
+    return df_clean.where(pd.notnull(df_clean), None).to_dict(orient="records")
+
+
+def _price_levels(values):
+    # float32 columns only hold 4-decimal ticks, so rounding restores the exact price: JSON shows
+    # 101.25 rather than 101.25000762939453. float64 prices are returned as they came.
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return np.round(values.astype(np.float64), 4).tolist()
+    return values.astype(np.float64).tolist()
+
+
+@with_client
+async def fetch_bars_async(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    deadline: Deadline | None = None,
+    *,
+    client: MassiveClient,
+) -> pd.DataFrame:
+    results = await client.get_aggregates(
+        ticker.upper().strip(),
+        multiplier,
+        _normalize_timeframe(timeframe),
+        start_date,
+        end_date,
+        deadline=deadline,
+    )
+    return build_bars_frame(results)
+
+
+def fetch_bars(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    config: MassiveConfig | None = None,
+) -> pd.DataFrame:
+    return run_with_client(config, fetch_bars_async, ticker, multiplier, timeframe, start_date, end_date)
+
+
+def _rank_levels(prices, levels=DEFAULT_LEVEL_COUNT, tolerance_pct=None):
+    if not tolerance_pct:
+        return _price_levels(pd.Series(prices).value_counts().nlargest(levels).index)
+
+    # Chain sorted pivots closer than tolerance_pct into one zone, then rank zones by pivot count.
+    ordered = np.sort(np.asarray(prices, dtype=np.float64))
+    if ordered.size == 0:
+        return []
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ordered) > ordered[:-1] * tolerance_pct / 100) + 1))
+    counts = np.diff(np.append(starts, ordered.size))
+    centers = np.add.reduceat(ordered, starts) / counts
+    # Zone centers are averages; zones lie more than tolerance_pct apart, so rounding cannot merge them.
+    return np.round(centers[np.argsort(-counts, kind="stable")[:levels]], 4).tolist()
+
+
+def _find_pivots(closes, distance, prominence):
+    # Scan newest-first, as the original desc-sorted bars were: distance pruning keeps the newer
+    # of two close pivots and equal-count levels rank by recency.
+    closes = closes[::-1]
+    peaks, _ = find_peaks(closes, distance=distance, prominence=prominence or None)
+    troughs, _ = find_peaks(-closes, distance=distance, prominence=prominence or None)
+    return closes[troughs], closes[peaks]
+
+
+def find_support_resistance(
+    df: pd.DataFrame,
+    distance: int = DEFAULT_PEAK_DISTANCE,
+    prominence: float | None = None,
+    levels: int = DEFAULT_LEVEL_COUNT,
+    tolerance_pct: float | None = None,
+) -> tuple[list[float], list[float]]:
+    support_prices, resistance_prices = _find_pivots(df["c"].to_numpy(), distance, prominence)
+    support_levels = _rank_levels(support_prices, levels, tolerance_pct)
+    resistance_levels = _rank_levels(resistance_prices, levels, tolerance_pct)
+    return support_levels, resistance_levels
+
+
+def _init_sweep_worker(closes):
+    global _SWEEP_CLOSES
+    _SWEEP_CLOSES = closes
+
+
+def _sweep_pivot_group(task, closes=None):
+    # Pivots depend only on distance/prominence, so each task finds them once and ranks every
+    # level-count/tolerance combination from the same arrays.
+    distance, prominence, level_counts, tolerances = task
+    closes = _SWEEP_CLOSES if closes is None else closes
+    support_prices, resistance_prices = _find_pivots(closes, distance, prominence)
+    return [
+        SweepRow(
+            distance=distance,
+            prominence=prominence,
+            levels=levels,
+            tolerance_pct=tolerance_pct,
+            support_levels=_rank_levels(support_prices, levels, tolerance_pct),
+            resistance_levels=_rank_levels(resistance_prices, levels, tolerance_pct),
+        )
+        for levels, tolerance_pct in itertools.product(level_counts, tolerances)
+    ]
+
+
+def sweep_support_resistance(
+    df: pd.DataFrame,
+    distances=DEFAULT_SWEEP_GRID["distances"],
+    prominences=DEFAULT_SWEEP_GRID["prominences"],
+    level_counts=DEFAULT_SWEEP_GRID["level_counts"],
+    tolerances=DEFAULT_SWEEP_GRID["tolerances"],
+    workers: int | None = None,
+) -> list[SweepRow]:
+    closes = df["c"].to_numpy()
+    tasks = [
+        (distance, prominence, tuple(level_counts), tuple(tolerances))
+        for distance, prominence in itertools.product(distances, prominences)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        groups = [_sweep_pivot_group(task, closes) for task in tasks]
+    else:
+        # Workers import this module by name, so any start method works now that it lives in a package.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_sweep_worker,
+            initargs=(closes,),
+        ) as executor:
+            groups = list(executor.map(_sweep_pivot_group, tasks))
+    return [row for group in groups for row in group]
+
+
+def build_volume_profile(
+    low,
+    high,
+    volume,
+    bins: int = VOLUME_PROFILE_BINS,
+    chunk_size: int = VOLUME_PROFILE_CHUNK_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Columns keep their compact dtypes; each chunk is widened to float64 and masked on its own,
+    # so temporaries stay bounded by chunk_size however many bars come in.
+    low, high, volume = np.asarray(low), np.asarray(high), np.asarray(volume)
+
+    def valid_chunks():
+        for start in range(0, len(volume), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            chunk_low = low[chunk].astype(np.float64)
+            chunk_high = high[chunk].astype(np.float64)
+            chunk_volume = volume[chunk].astype(np.float64)
+            keep = np.isfinite(chunk_low) & np.isfinite(chunk_high) & np.isfinite(chunk_volume) & (chunk_high >= chunk_low)
+            if keep.any():
+                yield chunk_low[keep], chunk_high[keep], chunk_volume[keep]
+
+    price_floor = np.inf
+    price_ceiling = -np.inf
+    for chunk_low, chunk_high, _chunk_volume in valid_chunks():
+        price_floor = min(price_floor, chunk_low.min())
+        price_ceiling = max(price_ceiling, chunk_high.max())
+    if not np.isfinite(price_floor):
+        raise RuntimeError("No valid OHLCV bars to build a volume profile")
+
+    edges = np.linspace(price_floor, max(price_ceiling, price_floor + 1e-6), bins + 1)
+    width = edges[1] - edges[0]
+
+    # Each bar's volume is spread evenly over the bins its high-low range touches. Spreads are
+    # accumulated as +share at the first bin and -share past the last one, then one cumsum
+    # turns that difference array into the profile.
+    difference = np.zeros(bins + 1)
+    for chunk_low, chunk_high, chunk_volume in valid_chunks():
+        first_bin = np.clip(((chunk_low - price_floor) // width).astype(np.int64), 0, bins - 1)
+        last_bin = np.clip(((chunk_high - price_floor) // width).astype(np.int64), 0, bins - 1)
+        share = chunk_volume / (last_bin - first_bin + 1)
+        difference += np.bincount(first_bin, weights=share, minlength=bins + 1)
+        difference -= np.bincount(last_bin + 1, weights=share, minlength=bins + 1)
+    return edges, np.cumsum(difference)[:bins]
+
+
+def _value_area_bins(profile: np.ndarray, value_area: float = VOLUME_PROFILE_VALUE_AREA) -> tuple[int, int]:
+    # Grow a contiguous range outward from the point of control, taking the heavier neighbour
+    # each step, until it holds `value_area` of all volume.
+    low = high = int(np.argmax(profile))
+    target = value_area * profile.sum()
+    covered = profile[low]
+    while covered < target and (low > 0 or high < len(profile) - 1):
+        below = profile[low - 1] if low > 0 else -1.0
+        above = profile[high + 1] if high < len(profile) - 1 else -1.0
+        if above >= below:
+            high += 1
+            covered += above
+        else:
+            low -= 1
+            covered += below
+    return low, high
+
+
+def find_volume_profile_levels(
+    df: pd.DataFrame,
+    bins: int = VOLUME_PROFILE_BINS,
+    value_area: float = VOLUME_PROFILE_VALUE_AREA,
+    top_n: int = DEFAULT_LEVEL_COUNT,
+) -> tuple[list[float], list[float], VolumeProfile]:
+    edges, profile = build_volume_profile(df["l"].to_numpy(), df["h"].to_numpy(), df["v"].to_numpy(), bins=bins)
+    centers = np.round((edges[:-1] + edges[1:]) / 2, 4)
+
+    value_area_low, value_area_high = _value_area_bins(profile, value_area)
+
+    # Pad with zeros so nodes in the first/last bin still count as peaks.
+    nodes, _ = find_peaks(np.concatenate(([0.0], profile, [0.0])))
+    nodes = nodes - 1
+    nodes = nodes[np.argsort(profile[nodes])[::-1]]
+
+    last_close = df["c"].iloc[df["t"].to_numpy().argmax()]
+    node_prices = centers[nodes]
+    support_levels = node_prices[node_prices < last_close][:top_n].tolist()
+    resistance_levels = node_prices[node_prices > last_close][:top_n].tolist()
+    summary = VolumeProfile(
+        point_of_control=float(centers[np.argmax(profile)]),
+        value_area_high=float(centers[value_area_high]),
+        value_area_low=float(centers[value_area_low]),
+        high_volume_nodes=node_prices[:top_n * 2].tolist(),
+    )
+    return support_levels, resistance_levels, summary
+
+
+def analyze_support_resistance(
+    df: pd.DataFrame,
+    include_data: bool = False,
+    method: str = "pivots",
+    distance: int = DEFAULT_PEAK_DISTANCE,
+    prominence: float | None = None,
+    levels: int = DEFAULT_LEVEL_COUNT,
+    tolerance_pct: float | None = None,
+) -> SupportResistanceResult:
+    volume_profile = None
+    if _normalize_method(method) == "volume-profile":
+        support_levels, resistance_levels, volume_profile = find_volume_profile_levels(df, top_n=levels)
+    else:
+        support_levels, resistance_levels = find_support_resistance(
+            df,
+            distance=distance,
+            prominence=prominence,
+            levels=levels,
+            tolerance_pct=tolerance_pct,
+        )
+    return SupportResistanceResult(
+        support_levels=support_levels,
+        resistance_levels=resistance_levels,
+        volume_profile=volume_profile,
+        bars=df if include_data else None,
+    )
+
+
+@with_client
+async def calculate_support_resistance_async(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    include_data: bool = False,
+    method: str = "pivots",
+    distance: int = DEFAULT_PEAK_DISTANCE,
+    prominence: float | None = None,
+    levels: int = DEFAULT_LEVEL_COUNT,
+    tolerance_pct: float | None = None,
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient,
+) -> SupportResistanceResult:
+    # Reject a bad method before spending a request on bars.
+    _normalize_method(method)
+    # Levels need every page of bars, so there is no partial answer: the range arrives in budget or fails.
+    deadline = Deadline(deadline_seconds)
+    df = await fetch_bars_async(ticker, multiplier, timeframe, start_date, end_date, deadline, client=client)
+    return analyze_support_resistance(
+        df,
+        include_data=include_data,
+        method=method,
+        distance=distance,
+        prominence=prominence,
+        levels=levels,
+        tolerance_pct=tolerance_pct,
+    )
+
+
+def calculate_support_resistance(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    include_data: bool = False,
+    method: str = "pivots",
+    distance: int = DEFAULT_PEAK_DISTANCE,
+    prominence: float | None = None,
+    levels: int = DEFAULT_LEVEL_COUNT,
+    tolerance_pct: float | None = None,
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> SupportResistanceResult:
+    return run_with_client(
+        config,
+        calculate_support_resistance_async,
+        ticker,
+        multiplier,
+        timeframe,
+        start_date,
+        end_date,
+        include_data=include_data,
+        method=method,
+        distance=distance,
+        prominence=prominence,
+        levels=levels,
+        tolerance_pct=tolerance_pct,
+        deadline_seconds=deadline_seconds,
+    )
+
+
+@with_client
+async def sweep_support_resistance_levels_async(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    distances=DEFAULT_SWEEP_GRID["distances"],
+    prominences=DEFAULT_SWEEP_GRID["prominences"],
+    level_counts=DEFAULT_SWEEP_GRID["level_counts"],
+    tolerances=DEFAULT_SWEEP_GRID["tolerances"],
+    workers: int | None = None,
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient,
+) -> SweepResult:
+    deadline = Deadline(deadline_seconds)
+    df = await fetch_bars_async(ticker, multiplier, timeframe, start_date, end_date, deadline, client=client)
+    rows = await asyncio.to_thread(
+        sweep_support_resistance,
+        df,
+        distances=distances,
+        prominences=prominences,
+        level_counts=level_counts,
+        tolerances=tolerances,
+        workers=workers,
+    )
+    return SweepResult(ticker=ticker.upper().strip(), bars=len(df), results=rows)
+
+
+def sweep_support_resistance_levels(
+    ticker: str,
+    multiplier: int,
+    timeframe: str,
+    start_date: str,
+    end_date: str,
+    distances=DEFAULT_SWEEP_GRID["distances"],
+    prominences=DEFAULT_SWEEP_GRID["prominences"],
+    level_counts=DEFAULT_SWEEP_GRID["level_counts"],
+    tolerances=DEFAULT_SWEEP_GRID["tolerances"],
+    workers: int | None = None,
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> SweepResult:
+    return run_with_client(
+        config,
+        sweep_support_resistance_levels_async,
+        ticker,
+        multiplier,
+        timeframe,
+        start_date,
+        end_date,
+        distances=distances,
+        prominences=prominences,
+        level_counts=level_counts,
+        tolerances=tolerances,
+        workers=workers,
+        deadline_seconds=deadline_seconds,
+    )
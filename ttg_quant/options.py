@@ -0,0 +1,736 @@
+import asyncio
+import bisect
+import collections
+import datetime as dt
+import itertools
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .client import Deadline, DeadlineExceeded, MassiveClient, run_with_client, with_client
+from .config import DEFAULT_RISK_FREE_RATE, MassiveConfig
+from .pricing import black_scholes_greeks, implied_volatility, years_to_expiry
+
+MONEYNESS_MODES = ("strike", "delta")
+SIDES = ("itm", "otm")
+SNAPSHOT_PAGE_LIMIT = 250
+# Full chains for liquid underlyings run to tens of thousands of contracts; keep only the most recent.
+CHAIN_CACHE_MAX_ENTRIES = 32
+OCC_SYMBOL_PATTERN = re.compile(r"^(?:O:)?(?P<underlying>[A-Z0-9.]+?)(?P<expiry>\d{6})(?P<type>[CP])(?P<strike>\d{8})$")
+
+# Shared by every event loop in the process (each sync call runs its own), so access is locked.
+_CHAIN_CACHE = collections.OrderedDict()
+_CHAIN_CACHE_LOCK = threading.Lock()
+
+
+def validate_expiration_date(value: str | None) -> str | None:
+    if value is None:
+        return None
+    clean = value.strip()
+    if not clean or clean.lower() == "string":
+        return None
+    try:
+        dt.datetime.strptime(clean, "%Y-%m-%d")
+    except ValueError as exc:
+        raise ValueError("Invalid expiration date format. Use YYYY-MM-DD.") from exc
+    return clean
+
+
+def _or_na(value):
+    return "N/A" if value is None else value
+
+
+@dataclass(slots=True)
+class OptionContract:
+    ticker: str
+    underlying: str
+    expiration_date: str
+    contract_type: str
+    strike_price: float
+    volume: int | None = None
+    open_interest: int | None = None
+    last_trade_price: float | None = None
+    implied_volatility: float | None = None
+    mid_price: float | None = None
+    delta: float | None = None
+    gamma: float | None = None
+    theta: float | None = None
+    vega: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "ticker": self.ticker,
+            "strike_price": self.strike_price,
+            "volume": _or_na(self.volume),
+            "type": self.contract_type,
+            "expiration_date": self.expiration_date,
+            "last_trade_price": _or_na(self.last_trade_price),
+            "implied_volatility": _or_na(self.implied_volatility),
+            "delta": _or_na(self.delta),
+            "gamma": _or_na(self.gamma),
+            "theta": _or_na(self.theta),
+            "vega": _or_na(self.vega),
+        }
+
+
+@dataclass(slots=True)
+class TopOptionsResult:
+    ticker: str
+    underlying_price: float
+    options: list[OptionContract]
+    # True when the deadline ran out and part of the chain was never fetched.
+    partial: bool = False
+
+    def to_dict(self) -> dict:
+        result = {
+            "ticker": self.ticker,
+            "underlying_price": self.underlying_price,
+            "options": [option.to_dict() for option in self.options],
+        }
+        if self.partial:
+            result["partial"] = True
+        return result
+
+
+@dataclass(slots=True)
+class ExpirationSummary:
+    expiration_date: str
+    call_volume: int
+    put_volume: int
+    options: list[OptionContract] = field(default_factory=list)
+
+    @property
+    def total_volume(self) -> int:
+        return self.call_volume + self.put_volume
+
+    @property
+    def put_call_ratio(self) -> float | None:
+        return round(self.put_volume / self.call_volume, 4) if self.call_volume else None
+
+    def to_dict(self) -> dict:
+        return {
+            "expiration_date": self.expiration_date,
+            "call_volume": self.call_volume,
+            "put_volume": self.put_volume,
+            "total_volume": self.total_volume,
+            "put_call_ratio": _or_na(self.put_call_ratio),
+            "options": [option.to_dict() for option in self.options],
+        }
+
+
+@dataclass(slots=True)
+class TermStructureResult:
+    ticker: str
+    underlying_price: float
+    expirations: list[ExpirationSummary]
+    partial: bool = False
+
+    def to_dict(self) -> dict:
+        result = {
+            "ticker": self.ticker,
+            "underlying_price": self.underlying_price,
+            "expirations": [expiration.to_dict() for expiration in self.expirations],
+        }
+        if self.partial:
+            result["partial"] = True
+        return result
+
+
+def parse_occ_symbol(symbol: str | None) -> tuple[str, str, str, float] | None:
+    match = OCC_SYMBOL_PATTERN.match(symbol or "")
+    if match is None:
+        return None
+    expiry = match.group("expiry")
+    return (
+        match.group("underlying"),
+        f"20{expiry[0:2]}-{expiry[2:4]}-{expiry[4:6]}",
+        "call" if match.group("type") == "C" else "put",
+        int(match.group("strike")) / 1000,
+    )
+
+
+def parse_option_contract(raw: dict) -> OptionContract | None:
+    details = raw.get("details") or {}
+    day = raw.get("day") or {}
+    greeks = raw.get("greeks") or {}
+    symbol = details.get("ticker", "")
+    occ = parse_occ_symbol(symbol)
+    if occ is None:
+        underlying = (raw.get("underlying_asset") or {}).get("ticker", "")
+        occ = (underlying, None, None, None)
+    expiration_date = details.get("expiration_date") or occ[1]
+    contract_type = details.get("contract_type") or occ[2]
+    strike_price = details.get("strike_price", occ[3])
+    if expiration_date is None or contract_type is None or strike_price is None:
+        # Neither the details nor the symbol identify the contract; it cannot be indexed or classified.
+        return None
+
+    # Intern the repeated strings so a chain shares one copy per value.
+    return OptionContract(
+        ticker=symbol,
+        underlying=sys.intern(occ[0] or ""),
+        expiration_date=sys.intern(expiration_date),
+        contract_type=sys.intern(contract_type),
+        strike_price=strike_price,
+        volume=day.get("volume"),
+        open_interest=raw.get("open_interest"),
+        last_trade_price=day.get("close"),
+        implied_volatility=raw.get("implied_volatility"),
+        mid_price=(raw.get("last_quote") or {}).get("midpoint"),
+        delta=greeks.get("delta"),
+        gamma=greeks.get("gamma"),
+        theta=greeks.get("theta"),
+        vega=greeks.get("vega"),
+    )
+
+
+def fill_missing_greeks(
+    options: list[OptionContract],
+    underlying_price: float,
+    as_of: dt.datetime | None = None,
+    rate: float = DEFAULT_RISK_FREE_RATE,
+) -> list[OptionContract]:
+    pending = [option for option in options if option.implied_volatility is None or option.delta is None]
+    if not pending:
+        return options
+
+    count = len(pending)
+    strikes = np.fromiter((option.strike_price for option in pending), dtype=float, count=count)
+    is_call = np.fromiter((option.contract_type == "call" for option in pending), dtype=bool, count=count)
+    quoted_iv = np.fromiter(
+        (np.nan if option.implied_volatility is None else option.implied_volatility for option in pending),
+        dtype=float,
+        count=count,
+    )
+    # Only solve where the snapshot has no IV; NaN prices are skipped by the solver.
+    prices = np.fromiter(
+        (
+            np.nan
+            if option.implied_volatility is not None
+            else option.mid_price or option.last_trade_price or np.nan
+            for option in pending
+        ),
+        dtype=float,
+        count=count,
+    )
+    years = years_to_expiry([option.expiration_date for option in pending], as_of=as_of)
+
+    solved_iv = implied_volatility(prices, underlying_price, strikes, years, is_call, rate=rate)
+    volatility = np.where(np.isnan(quoted_iv), solved_iv, quoted_iv)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        greeks = black_scholes_greeks(underlying_price, strikes, years, volatility, is_call, rate=rate)
+
+    for index, option in enumerate(pending):
+        if option.implied_volatility is None and np.isfinite(volatility[index]):
+            option.implied_volatility = round(float(volatility[index]), 6)
+        for name, values in greeks.items():
+            if getattr(option, name) is None and np.isfinite(values[index]):
+                setattr(option, name, round(float(values[index]), 6))
+    return options
+
+
+@with_client
+async def get_underlying_prices_async(tickers: list[str], *, client: MassiveClient) -> dict[str, float]:
+    return await client.get_underlying_prices([ticker.upper().strip() for ticker in tickers])
+
+
+def get_underlying_prices(tickers: list[str], config: MassiveConfig | None = None) -> dict[str, float]:
+    return run_with_client(config, get_underlying_prices_async, tickers)
+
+
+@with_client
+async def get_options_chain_async(
+    ticker: str,
+    expiration_date: str | None = None,
+    contract_type: str | None = None,
+    strike_price_gte: float | None = None,
+    strike_price_lte: float | None = None,
+    limit: int = 100,
+    max_pages: int | None = 1,
+    deadline: Deadline | None = None,
+    *,
+    client: MassiveClient,
+) -> list[OptionContract]:
+    filters = {"limit": limit}
+    if expiration_date:
+        filters["expiration_date"] = expiration_date
+    if contract_type:
+        filters["contract_type"] = contract_type
+    if strike_price_gte is not None:
+        filters["strike_price.gte"] = strike_price_gte
+    if strike_price_lte is not None:
+        filters["strike_price.lte"] = strike_price_lte
+    results = await client.get_options_snapshot(ticker, filters, max_pages=max_pages, deadline=deadline)
+    contracts = (parse_option_contract(raw) for raw in results)
+    return [contract for contract in contracts if contract is not None]
+
+
+class OptionChainIndex:
+    """Chain snapshot indexed by expiration and contract type, with strike-sorted buckets."""
+
+    def __init__(self, options: list[OptionContract]):
+        self._buckets = {}
+        self._volumes = {}
+        ordered = sorted(options, key=lambda option: (option.expiration_date, option.contract_type, option.strike_price))
+        for key, group in itertools.groupby(ordered, key=lambda option: (option.expiration_date, option.contract_type)):
+            contracts = list(group)
+            self._buckets[key] = ([option.strike_price for option in contracts], contracts)
+            self._volumes[key] = sum(option.volume or 0 for option in contracts)
+        self.expirations = sorted({expiration for expiration, _contract_type in self._buckets})
+
+    def __len__(self) -> int:
+        return sum(len(contracts) for _strikes, contracts in self._buckets.values())
+
+    def contracts(self) -> list[OptionContract]:
+        return [option for _strikes, contracts in self._buckets.values() for option in contracts]
+
+    def has_expiration(self, expiration_date: str) -> bool:
+        position = bisect.bisect_left(self.expirations, expiration_date)
+        return position < len(self.expirations) and self.expirations[position] == expiration_date
+
+    def nearest_expiration(self, on_or_after: str | None = None) -> str | None:
+        position = bisect.bisect_left(self.expirations, on_or_after) if on_or_after else 0
+        return self.expirations[position] if position < len(self.expirations) else None
+
+    def _bucket(self, expiration_date, contract_type):
+        return self._buckets.get((expiration_date, contract_type), ((), ()))
+
+    def contracts_for(self, expiration_date: str, contract_type: str | None = None) -> list[OptionContract]:
+        if contract_type is not None:
+            return list(self._bucket(expiration_date, contract_type)[1])
+        return [*self._bucket(expiration_date, "call")[1], *self._bucket(expiration_date, "put")[1]]
+
+    def itm(self, expiration_date: str, underlying_price: float) -> list[OptionContract]:
+        call_strikes, calls = self._bucket(expiration_date, "call")
+        put_strikes, puts = self._bucket(expiration_date, "put")
+        return [
+            *calls[: bisect.bisect_left(call_strikes, underlying_price)],
+            *puts[bisect.bisect_right(put_strikes, underlying_price) :],
+        ]
+
+    def otm(self, expiration_date: str, underlying_price: float) -> list[OptionContract]:
+        call_strikes, calls = self._bucket(expiration_date, "call")
+        put_strikes, puts = self._bucket(expiration_date, "put")
+        return [
+            *calls[bisect.bisect_right(call_strikes, underlying_price) :],
+            *puts[: bisect.bisect_left(put_strikes, underlying_price)],
+        ]
+
+    def volume(self, expiration_date: str, contract_type: str) -> int:
+        return self._volumes.get((expiration_date, contract_type), 0)
+
+    def around_the_money(
+        self,
+        expiration_date: str,
+        contract_type: str,
+        underlying_price: float,
+        count: int,
+    ) -> list[OptionContract]:
+        strikes, contracts = self._bucket(expiration_date, contract_type)
+        start = max(0, min(bisect.bisect_left(strikes, underlying_price) - count // 2, len(contracts) - count))
+        return list(contracts[start : start + count])
+
+
+def _cache_get(key, ttl_seconds):
+    with _CHAIN_CACHE_LOCK:
+        entry = _CHAIN_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > ttl_seconds:
+            _CHAIN_CACHE.pop(key, None)
+            return None
+        _CHAIN_CACHE.move_to_end(key)
+        return value
+
+
+def _cache_put(key, value, ttl_seconds):
+    if ttl_seconds <= 0:
+        return value
+    with _CHAIN_CACHE_LOCK:
+        now = time.monotonic()
+        # Drop expired snapshots even if their key is never read again, then evict least recently used.
+        for expired in [cached for cached, (stored_at, _value) in _CHAIN_CACHE.items() if now - stored_at > ttl_seconds]:
+            del _CHAIN_CACHE[expired]
+        _CHAIN_CACHE[key] = (now, value)
+        _CHAIN_CACHE.move_to_end(key)
+        while len(_CHAIN_CACHE) > CHAIN_CACHE_MAX_ENTRIES:
+            _CHAIN_CACHE.popitem(last=False)
+    return value
+
+
+def _normalize_side(side):
+    if side not in SIDES:
+        raise ValueError(f"Invalid side '{side}'. Supported values: {'|'.join(SIDES)}")
+    return side
+
+
+def _normalize_moneyness(moneyness):
+    if moneyness not in MONEYNESS_MODES:
+        raise ValueError(f"Invalid moneyness '{moneyness}'. Supported values: {'|'.join(MONEYNESS_MODES)}")
+    return moneyness
+
+
+def _strike_range(underlying_price, strike_range_pct):
+    if not strike_range_pct:
+        return None, None
+    depth = underlying_price * strike_range_pct / 100
+    return underlying_price - depth, underlying_price + depth
+
+
+def full_chain_filters(underlying_price: float, strike_range_pct: float | None = None) -> tuple[dict, dict]:
+    lower, upper = _strike_range(underlying_price, strike_range_pct)
+    return (
+        {"contract_type": "call", "strike_price_gte": lower, "strike_price_lte": upper},
+        {"contract_type": "put", "strike_price_gte": lower, "strike_price_lte": upper},
+    )
+
+
+def chain_filters(
+    side: str,
+    underlying_price: float,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+) -> tuple[dict, dict]:
+    if moneyness == "delta":
+        # Delta can put a contract on either side of spot, so only the optional range applies.
+        return full_chain_filters(underlying_price, strike_range_pct)
+    lower, upper = _strike_range(underlying_price, strike_range_pct)
+    below = {"strike_price_gte": lower, "strike_price_lte": underlying_price}
+    above = {"strike_price_gte": underlying_price, "strike_price_lte": upper}
+    # ITM calls sit below spot and ITM puts above it (OTM the reverse); the optional range caps the window.
+    call_window, put_window = (below, above) if side == "itm" else (above, below)
+    return (
+        {"contract_type": "call", **call_window},
+        {"contract_type": "put", **put_window},
+    )
+
+
+def filter_options(
+    options: list[OptionContract],
+    underlying_price: float,
+    side: str = "itm",
+    moneyness: str = "strike",
+) -> list[OptionContract]:
+    selected = []
+    for option in options:
+        if moneyness == "delta":
+            if option.delta is not None and (abs(option.delta) > 0.5) == (side == "itm"):
+                selected.append(option)
+            continue
+        strike_price = option.strike_price
+        contract_type = option.contract_type
+        in_the_money = (contract_type == "call" and strike_price < underlying_price) or (contract_type == "put" and strike_price > underlying_price)
+        out_of_the_money = (contract_type == "call" and strike_price > underlying_price) or (contract_type == "put" and strike_price < underlying_price)
+        if in_the_money if side == "itm" else out_of_the_money:
+            selected.append(option)
+    return selected
+
+
+async def load_chain_index_async(
+    ticker: str,
+    side: str = "itm",
+    expiration_date: str | None = None,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    full_chain: bool = False,
+    deadline: Deadline | None = None,
+    *,
+    client: MassiveClient,
+) -> tuple[float, OptionChainIndex]:
+    config = client.config
+    # Full-chain and delta fetches do not depend on the side, so ITM and OTM share those entries.
+    window = None if full_chain or moneyness == "delta" else side
+    cache_key = (config.base_url, ticker, window, expiration_date, strike_range_pct, moneyness, full_chain)
+    cached = _cache_get(cache_key, config.chain_cache_ttl_seconds)
+    if cached is not None:
+        return cached
+
+    underlying_price = await client.get_underlying_price(ticker, deadline=deadline)
+    if full_chain:
+        # Every strike and expiration, paged through to the end.
+        filter_sets = full_chain_filters(underlying_price, strike_range_pct)
+        page_options = {"limit": SNAPSHOT_PAGE_LIMIT, "max_pages": None}
+    elif moneyness == "delta":
+        # With no strike window, a first page only holds the lowest strikes of each type, so the
+        # expiration is paged to the end. Snapshots list the nearest expiration first; without
+        # one, a one-contract probe pins it so only that expiration is paged.
+        if expiration_date is None:
+            probe = await get_options_chain_async(ticker, limit=1, deadline=deadline, client=client)
+            expiration_date = probe[0].expiration_date if probe else None
+        filter_sets = chain_filters(side, underlying_price, strike_range_pct, moneyness)
+        page_options = {"limit": SNAPSHOT_PAGE_LIMIT, "max_pages": None}
+    else:
+        filter_sets = chain_filters(side, underlying_price, strike_range_pct, moneyness)
+        page_options = {}
+    chain_parts = await asyncio.gather(
+        *(
+            get_options_chain_async(
+                ticker,
+                expiration_date=expiration_date,
+                **filters,
+                **page_options,
+                deadline=deadline,
+                client=client,
+            )
+            for filters in filter_sets
+        ),
+        return_exceptions=True,
+    )
+    options_chain = []
+    for part in chain_parts:
+        if isinstance(part, DeadlineExceeded):
+            # One side missed the budget; answer from the other and flag the result partial.
+            deadline.partial = True
+            continue
+        if isinstance(part, BaseException):
+            raise part
+        options_chain.extend(part)
+    if not options_chain and deadline is not None and deadline.partial:
+        raise deadline.exceeded()
+
+    fill_missing_greeks(options_chain, underlying_price, rate=config.risk_free_rate)
+    snapshot = (underlying_price, OptionChainIndex(options_chain))
+    if deadline is not None and deadline.partial:
+        return snapshot
+    return _cache_put(cache_key, snapshot, config.chain_cache_ttl_seconds)
+
+
+def _select(chain_index, side, expiration_date, underlying_price, moneyness):
+    if moneyness == "delta":
+        return filter_options(chain_index.contracts_for(expiration_date), underlying_price, side, moneyness)
+    if side == "itm":
+        return chain_index.itm(expiration_date, underlying_price)
+    return chain_index.otm(expiration_date, underlying_price)
+
+
+def _top_by_volume(options, top_n):
+    return sorted(options, key=lambda option: option.volume or 0, reverse=True)[:top_n]
+
+
+def select_top_options(
+    ticker: str,
+    underlying_price: float,
+    chain_index: OptionChainIndex,
+    side: str = "itm",
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    moneyness: str = "strike",
+    partial: bool = False,
+) -> TopOptionsResult:
+    side = _normalize_side(side)
+    validated_expiration = validate_expiration_date(expiration_date)
+    moneyness = _normalize_moneyness(moneyness)
+    if validated_expiration:
+        if not chain_index.has_expiration(validated_expiration):
+            raise RuntimeError("No options contracts found for the given expiration date.")
+        selected_expiration = validated_expiration
+    else:
+        selected_expiration = chain_index.nearest_expiration()
+
+    selected = _select(chain_index, side, selected_expiration, underlying_price, moneyness)
+    if not selected:
+        raise RuntimeError(f"No {side.upper()} options found.")
+
+    return TopOptionsResult(
+        ticker=ticker.upper().strip(),
+        underlying_price=underlying_price,
+        options=_top_by_volume(selected, top_n),
+        partial=partial,
+    )
+
+
+@with_client
+async def get_top_options_async(
+    ticker: str,
+    side: str = "itm",
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient,
+) -> TopOptionsResult:
+    deadline = Deadline(deadline_seconds)
+    normalized_ticker = ticker.upper().strip()
+    side = _normalize_side(side)
+    validated_expiration = validate_expiration_date(expiration_date)
+    moneyness = _normalize_moneyness(moneyness)
+
+    underlying_price, chain_index = await load_chain_index_async(
+        normalized_ticker,
+        side,
+        expiration_date=validated_expiration,
+        strike_range_pct=strike_range_pct,
+        moneyness=moneyness,
+        deadline=deadline,
+        client=client,
+    )
+    return select_top_options(
+        normalized_ticker,
+        underlying_price,
+        chain_index,
+        side,
+        validated_expiration,
+        top_n,
+        moneyness,
+        partial=deadline.partial,
+    )
+
+
+@with_client
+async def get_term_structure_async(
+    ticker: str,
+    side: str = "itm",
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient,
+) -> TermStructureResult:
+    deadline = Deadline(deadline_seconds)
+    normalized_ticker = ticker.upper().strip()
+    side = _normalize_side(side)
+    moneyness = _normalize_moneyness(moneyness)
+
+    underlying_price, chain_index = await load_chain_index_async(
+        normalized_ticker,
+        side,
+        strike_range_pct=strike_range_pct,
+        moneyness=moneyness,
+        full_chain=True,
+        deadline=deadline,
+        client=client,
+    )
+    if not chain_index.expirations:
+        raise RuntimeError("No options contracts found.")
+
+    return TermStructureResult(
+        ticker=normalized_ticker,
+        underlying_price=underlying_price,
+        expirations=[
+            ExpirationSummary(
+                expiration_date=expiration_date,
+                call_volume=chain_index.volume(expiration_date, "call"),
+                put_volume=chain_index.volume(expiration_date, "put"),
+                options=_top_by_volume(_select(chain_index, side, expiration_date, underlying_price, moneyness), top_n),
+            )
+            for expiration_date in chain_index.expirations
+        ],
+        partial=deadline.partial,
+    )
+
+
+async def get_top_itm_options_async(
+    ticker: str,
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient | None = None,
+) -> TopOptionsResult:
+    return await get_top_options_async(
+        ticker,
+        "itm",
+        expiration_date,
+        top_n,
+        strike_range_pct,
+        moneyness,
+        deadline_seconds,
+        client=client,
+    )
+
+
+async def get_top_otm_options_async(
+    ticker: str,
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    *,
+    client: MassiveClient | None = None,
+) -> TopOptionsResult:
+    return await get_top_options_async(
+        ticker,
+        "otm",
+        expiration_date,
+        top_n,
+        strike_range_pct,
+        moneyness,
+        deadline_seconds,
+        client=client,
+    )
+
+
+def get_top_itm_options(
+    ticker: str,
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> TopOptionsResult:
+    return run_with_client(
+        config,
+        get_top_options_async,
+        ticker,
+        "itm",
+        expiration_date,
+        top_n,
+        strike_range_pct,
+        moneyness,
+        deadline_seconds,
+    )
+
+
+def get_top_otm_options(
+    ticker: str,
+    expiration_date: str | None = None,
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> TopOptionsResult:
+    return run_with_client(
+        config,
+        get_top_options_async,
+        ticker,
+        "otm",
+        expiration_date,
+        top_n,
+        strike_range_pct,
+        moneyness,
+        deadline_seconds,
+    )
+
+
+def get_term_structure(
+    ticker: str,
+    side: str = "itm",
+    top_n: int = 2,
+    strike_range_pct: float | None = None,
+    moneyness: str = "strike",
+    deadline_seconds: float | None = None,
+    config: MassiveConfig | None = None,
+) -> TermStructureResult:
+    return run_with_client(
+        config,
+        get_term_structure_async,
+        ticker,
+        side,
+        top_n,
+        strike_range_pct,
+        moneyness,
+        deadline_seconds,
+    )
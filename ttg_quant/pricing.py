@@ -0,0 +1,136 @@
+import datetime as dt
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.special import ndtr
+
+from .config import DEFAULT_RISK_FREE_RATE
+
+IV_LOWER_BOUND = 1e-4
+IV_UPPER_BOUND = 5.0
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+# Equity options stop trading at 16:00 New York time; 20:00 UTC is close enough for pricing.
+EXPIRY_CUTOFF_UTC = np.timedelta64(20, "h")
+
+
+def _d1_d2(spot, strike, years, volatility, rate):
+    vol_sqrt_t = volatility * np.sqrt(years)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * volatility**2) * years) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def _normal_pdf(x):
+    return np.exp(-0.5 * x**2) / np.sqrt(2 * np.pi)
+
+
+def black_scholes_price(
+    spot: ArrayLike,
+    strike: ArrayLike,
+    years: ArrayLike,
+    volatility: ArrayLike,
+    is_call: ArrayLike,
+    rate: float = DEFAULT_RISK_FREE_RATE,
+) -> np.ndarray:
+    d1, d2 = _d1_d2(spot, strike, years, volatility, rate)
+    discounted_strike = strike * np.exp(-rate * years)
+    call_price = spot * ndtr(d1) - discounted_strike * ndtr(d2)
+    # Put-call parity avoids a second pair of normal CDF evaluations.
+    return np.where(is_call, call_price, call_price - spot + discounted_strike)
+
+
+def black_scholes_greeks(
+    spot: ArrayLike,
+    strike: ArrayLike,
+    years: ArrayLike,
+    volatility: ArrayLike,
+    is_call: ArrayLike,
+    rate: float = DEFAULT_RISK_FREE_RATE,
+) -> dict[str, np.ndarray]:
+    # Theta is per calendar day and vega per one volatility point, matching the snapshot greeks.
+    d1, d2 = _d1_d2(spot, strike, years, volatility, rate)
+    sqrt_t = np.sqrt(years)
+    pdf_d1 = _normal_pdf(d1)
+    discounted_strike = strike * np.exp(-rate * years)
+    decay = -spot * pdf_d1 * volatility / (2 * sqrt_t)
+    call_theta = decay - rate * discounted_strike * ndtr(d2)
+    put_theta = decay + rate * discounted_strike * ndtr(-d2)
+    return {
+        "delta": np.where(is_call, ndtr(d1), ndtr(d1) - 1),
+        "gamma": pdf_d1 / (spot * volatility * sqrt_t),
+        "theta": np.where(is_call, call_theta, put_theta) / 365,
+        "vega": spot * pdf_d1 * sqrt_t / 100,
+    }
+
+
+def _initial_volatility_guess(price, spot, strike, years, is_call, rate):
+    # Corrado-Miller closed-form approximation; lands within a few Newton steps of the root.
+    discounted_strike = strike * np.exp(-rate * years)
+    call_price = np.where(is_call, price, price + spot - discounted_strike)
+    half_gap = (spot - discounted_strike) / 2
+    radicand = (call_price - half_gap) ** 2 - (spot - discounted_strike) ** 2 / np.pi
+    guess = (
+        np.sqrt(2 * np.pi / years)
+        / (spot + discounted_strike)
+        * (call_price - half_gap + np.sqrt(np.maximum(radicand, 0)))
+    )
+    return np.where(np.isfinite(guess) & (guess > IV_LOWER_BOUND) & (guess < IV_UPPER_BOUND), guess, 0.3)
+
+
+def implied_volatility(
+    price: ArrayLike,
+    spot: ArrayLike,
+    strike: ArrayLike,
+    years: ArrayLike,
+    is_call: ArrayLike,
+    rate: float = DEFAULT_RISK_FREE_RATE,
+    tolerance: float = 1e-6,
+    max_iterations: int = 50,
+) -> np.ndarray:
+    price, spot, strike, years, is_call = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(years, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    volatility = np.full(price.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        discounted_strike = strike * np.exp(-rate * years)
+        intrinsic = np.where(is_call, np.maximum(spot - discounted_strike, 0), np.maximum(discounted_strike - spot, 0))
+        ceiling = np.where(is_call, spot, discounted_strike)
+        solvable = np.isfinite(price) & (years > 0) & (spot > 0) & (strike > 0) & (price > intrinsic) & (price < ceiling)
+
+        # Safeguarded Newton over the whole chain at once: price is monotonic in volatility, so
+        # every step narrows a bracket and falls back to bisection when Newton leaves it.
+        # Converged contracts drop out of the working set so late iterations stay cheap.
+        active = np.flatnonzero(solvable)
+        target, s, k, t, call = price[active], spot[active], strike[active], years[active], is_call[active]
+        low = np.full(active.shape, IV_LOWER_BOUND)
+        high = np.full(active.shape, IV_UPPER_BOUND)
+        sigma = _initial_volatility_guess(target, s, k, t, call, rate)
+        for _ in range(max_iterations):
+            if active.size == 0:
+                break
+            d1, _d2 = _d1_d2(s, k, t, sigma, rate)
+            error = black_scholes_price(s, k, t, sigma, call, rate) - target
+            high = np.where(error > 0, sigma, high)
+            low = np.where(error < 0, sigma, low)
+            newton = sigma - error / (s * _normal_pdf(d1) * np.sqrt(t))
+            stepped = np.where((newton > low) & (newton < high), newton, 0.5 * (low + high))
+
+            solved = np.abs(error) < tolerance
+            volatility[active[solved]] = sigma[solved]
+            stalled = ~solved & (np.abs(stepped - sigma) < tolerance * 1e-3)
+            volatility[active[stalled]] = stepped[stalled]
+            keep = ~(solved | stalled)
+            active, target, s, k, t, call = active[keep], target[keep], s[keep], k[keep], t[keep], call[keep]
+            low, high, sigma = low[keep], high[keep], stepped[keep]
+
+    return volatility
+
+
+def years_to_expiry(expiration_dates: ArrayLike, as_of: dt.datetime | None = None) -> np.ndarray:
+    as_of = np.datetime64(as_of or dt.datetime.now(dt.timezone.utc).replace(tzinfo=None), "s")
+    expiries = np.asarray(expiration_dates, dtype="datetime64[D]") + EXPIRY_CUTOFF_UTC
+    seconds = (expiries - as_of).astype("timedelta64[s]").astype(float)
+    return np.maximum(seconds, 0) / SECONDS_PER_YEAR